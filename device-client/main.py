@@ -10,6 +10,7 @@ import time
 import signal
 import logging
 import asyncio
+import threading
 from pathlib import Path
 from typing import Optional, Dict, Any
 
@@ -20,7 +21,7 @@ from src.api_client import DeviceAPIClient
 from src.system_metrics import get_system_metrics
 from src.content_manager import ContentManager
 from src.display_manager import DisplayManager, DisplayConfig, DisplayType
-from src.playlist_fetcher import PlaylistFetcher
+from src.playlist_fetcher import Playlist, PlaylistFetcher
 from src.model_loader import ModelLoader
 from config.config import load_config, DISPLAY_TYPES, HARDWARE_TYPE_MAP
 
@@ -99,6 +100,10 @@ class DeviceClient:
         self._running = False
         self._current_playlist: Optional[Dict[str, Any]] = None
         self._current_item_index = 0
+        # Updated playlist (downloaded, not yet shown) handed from the poll
+        # thread to the main loop
+        self._pending_playlist: Optional[Dict[str, Any]] = None
+        self._poll_thread: Optional[threading.Thread] = None
 
     def authenticate(self) -> bool:
         """Authenticate device with backend."""
@@ -213,12 +218,17 @@ class DeviceClient:
 
         return success
 
-    def display_playlist_item(self, item: Dict[str, Any]) -> bool:
+    def display_playlist_item(
+        self,
+        item: Dict[str, Any],
+        next_item: Optional[Dict[str, Any]] = None,
+    ) -> bool:
         """
         Display a single playlist item.
 
         Args:
             item: Playlist item dictionary
+            next_item: Optional upcoming item to preload while this one shows
 
         Returns:
             True if successful
@@ -231,7 +241,7 @@ class DeviceClient:
 
         logger.info(f"Displaying: {asset_id} ({duration}s)")
 
-        success = self.display.show_playlist_item(item, self.content_manager)
+        success = self.display.show_playlist_item(item, self.content_manager, next_item)
 
         if success and duration:
             # Wait for duration (or user interrupt)
@@ -264,7 +274,8 @@ class DeviceClient:
             while self._running:
                 # Get current item (loop around)
                 item = items[self._current_item_index]
-                success = self.display_playlist_item(item)
+                next_item = items[(self._current_item_index + 1) % len(items)]
+                success = self.display_playlist_item(item, next_item)
 
                 # If display failed, wait a bit before retry to prevent tight loop
                 if not success:
@@ -299,6 +310,68 @@ class DeviceClient:
             logger.error(f"✗ Display error: {e}")
             return False
 
+    def _playlist_to_dict(self, playlist: Playlist) -> Dict[str, Any]:
+        """Convert a fetched Playlist into the dict form the display loop uses."""
+        return {
+            "id": playlist.id,
+            "name": playlist.name,
+            "description": playlist.description,
+            "loop_mode": playlist.loop_mode,
+            "shuffle": playlist.shuffle,
+            "transition_type": playlist.transition_type,
+            "transition_duration_ms": playlist.transition_duration_ms,
+            "is_active": playlist.is_active,
+            "total_duration_sec": playlist.total_duration_sec,
+            "item_count": playlist.item_count,
+            "items": [
+                {
+                    "id": item.id,
+                    "asset_id": item.asset_id,
+                    "position": item.position,
+                    "duration_seconds": item.duration_seconds,
+                    "asset_file_path": item.asset_file_path,
+                    "asset_file_size": item.asset_file_size,
+                    "asset_mime_type": item.asset_mime_type,
+                    "custom_settings": item.custom_settings,
+                    "transition_override": item.transition_override,
+                }
+                for item in playlist.items
+            ],
+        }
+
+    def _poll_playlist_loop(self, device_id: str, shown: Playlist) -> None:
+        """
+        Background thread: re-fetch the playlist whenever a poll is due.
+
+        Changed playlists are downloaded here and handed to the main loop
+        through _pending_playlist. stop() wakes the wait immediately.
+
+        Args:
+            device_id: Device ID
+            shown: Playlist the main loop is currently showing
+        """
+        while self._running:
+            self.playlist_fetcher.wait_for_next_poll()
+            if not self._running:
+                break
+
+            playlist = self.playlist_fetcher.fetch_assigned_playlist(device_id)
+            if playlist is None or playlist is shown:
+                continue
+            if playlist.id == shown.id and playlist.content_key == shown.content_key:
+                continue
+            if not playlist.items:
+                logger.warning(f"Updated playlist '{playlist.name}' has no items; keeping current one")
+                continue
+
+            logger.info(f"Playlist changed to '{playlist.name}', downloading content...")
+            playlist_dict = self._playlist_to_dict(playlist)
+            if self.download_playlist_content(playlist_dict):
+                self._pending_playlist = playlist_dict
+                shown = playlist
+            else:
+                logger.error("Failed to download updated playlist content")
+
     def start(self) -> None:
         """Start device client."""
         logger.info("=" * 60)
@@ -340,32 +413,7 @@ class DeviceClient:
                 return
 
             # Convert Playlist dataclass to dict for compatibility
-            playlist_dict = {
-                "id": playlist.id,
-                "name": playlist.name,
-                "description": playlist.description,
-                "loop_mode": playlist.loop_mode,
-                "shuffle": playlist.shuffle,
-                "transition_type": playlist.transition_type,
-                "transition_duration_ms": playlist.transition_duration_ms,
-                "is_active": playlist.is_active,
-                "total_duration_sec": playlist.total_duration_sec,
-                "item_count": playlist.item_count,
-                "items": [
-                    {
-                        "id": item.id,
-                        "asset_id": item.asset_id,
-                        "position": item.position,
-                        "duration_seconds": item.duration_seconds,
-                        "asset_file_path": item.asset_file_path,
-                        "asset_file_size": item.asset_file_size,
-                        "asset_mime_type": item.asset_mime_type,
-                        "custom_settings": item.custom_settings,
-                        "transition_override": item.transition_override,
-                    }
-                    for item in playlist.items
-                ],
-            }
+            playlist_dict = self._playlist_to_dict(playlist)
 
             # Step 4: Download content
             if not self.download_playlist_content(playlist_dict):
@@ -383,8 +431,12 @@ class DeviceClient:
             last_item_time = 0
             last_heartbeat_time = 0
 
+            # Resolve every item to displayable content once, up front
+            items = playlist_dict["items"]
+            prepared = self.display.prepare_playlist(items, self.content_manager)
+
             # Get first item duration
-            first_item = playlist_dict["items"][0]
+            first_item = items[0]
             current_duration = first_item.get("duration_seconds", 10)
 
             # Track render count for logging
@@ -397,17 +449,40 @@ class DeviceClient:
             # Track current asset to avoid unnecessary reloading
             current_asset_id = None
 
+            # Poll for playlist updates in the background
+            self._poll_thread = threading.Thread(
+                target=self._poll_playlist_loop,
+                args=(device_id, playlist),
+                name="playlist-poll",
+                daemon=True,
+            )
+            self._poll_thread.start()
+
             while self._running:
                 current_time = time_module.time()
 
+                # Switch to an updated playlist from the poll thread, starting
+                # from its first item
+                pending = self._pending_playlist
+                if pending is not None:
+                    self._pending_playlist = None
+                    playlist_dict = pending
+                    items = playlist_dict["items"]
+                    prepared = self.display.prepare_playlist(items, self.content_manager)
+                    playlist_dict["current_item_idx"] = len(items) - 1
+                    last_item_time = 0
+                    current_duration = 0
+                    current_asset_id = None
+
                 # Check if we need to switch to next playlist item
                 if current_time - last_item_time >= current_duration:
                     # Move to next item
-                    playlist_dict["current_item_idx"] = (
-                        playlist_dict["current_item_idx"] + 1
-                    ) % len(playlist_dict["items"])
+                    idx = (playlist_dict["current_item_idx"] + 1) % len(items)
+                    playlist_dict["current_item_idx"] = idx
 
-                    item = playlist_dict["items"][playlist_dict["current_item_idx"]]
+                    item = items[idx]
+                    content = prepared[idx]
+                    next_content = prepared[(idx + 1) % len(items)]
                     new_asset_id = item.get("asset_id")
                     current_duration = item.get("duration_seconds", 10)
                     last_item_time = current_time
@@ -415,7 +490,10 @@ class DeviceClient:
                     # Only reload if asset changed
                     if new_asset_id != current_asset_id:
                         logger.info(f"Loading new asset: {new_asset_id} ({current_duration}s)")
-                        self.display_playlist_item(item)
+                        if content is not None:
+                            self.display.show_content(content)
+                            if next_content is not None:
+                                self.display.preload(next_content)
                         current_asset_id = new_asset_id
                     else:
                         logger.debug(f"Continuing to display: {new_asset_id}")
@@ -456,6 +534,8 @@ class DeviceClient:
         """Stop device client."""
         logger.info("Stopping device client...")
         self._running = False
+        # Wake the playlist poll thread so it exits now rather than after its wait
+        self.playlist_fetcher.trigger_refresh()
 
     def shutdown(self) -> None:
         """Cleanup and shutdown."""
@@ -467,6 +547,9 @@ class DeviceClient:
         if self.api_client:
             self.api_client.close()
 
+        if self.metrics:
+            self.metrics.close()
+
         logger.info("Shutdown complete")
 
 
@@ -4,10 +4,13 @@ Device API Client
 Handles communication between device and HoloHub backend.
 """
 import os
+import copy
 import time
 import json
 import logging
-from typing import Optional, Dict, Any
+import threading
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple, Union
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -16,6 +19,56 @@ import httpx
 
 logger = logging.getLogger(__name__)
 
+# Read size for streaming content downloads
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# In-memory cache for asset/device lookups
+LOOKUP_CACHE_TTL_SEC = 300
+LOOKUP_CACHE_MAX_SIZE = 256
+
+# Returned by get_assigned_playlist when the server answers 304 Not Modified
+PLAYLIST_NOT_MODIFIED = object()
+
+
+def _build_heartbeat_payload(
+    cpu_percent,
+    memory_percent,
+    storage_used_gb,
+    temperature_celsius,
+    bandwidth_mbps,
+    latency_ms,
+    current_playlist_id,
+    current_asset_id,
+    playback_position_sec,
+    firmware_version,
+    client_version,
+) -> Dict[str, Any]:
+    """Build heartbeat payload in a single pass, omitting None values."""
+    payload = {}
+    if cpu_percent is not None:
+        payload["cpu_usage_percent"] = cpu_percent
+    if memory_percent is not None:
+        payload["memory_usage_percent"] = memory_percent
+    if storage_used_gb is not None:
+        payload["storage_used_gb"] = storage_used_gb
+    if temperature_celsius is not None:
+        payload["temperature_celsius"] = temperature_celsius
+    if bandwidth_mbps is not None:
+        payload["bandwidth_mbps"] = bandwidth_mbps
+    if latency_ms is not None:
+        payload["latency_ms"] = latency_ms
+    if current_playlist_id is not None:
+        payload["current_playlist_id"] = current_playlist_id
+    if current_asset_id is not None:
+        payload["current_asset_id"] = current_asset_id
+    if playback_position_sec is not None:
+        payload["playback_position_sec"] = playback_position_sec
+    if firmware_version is not None:
+        payload["firmware_version"] = firmware_version
+    if client_version is not None:
+        payload["client_version"] = client_version
+    return payload
+
 
 @dataclass
 class AuthToken:
@@ -54,6 +107,14 @@ class DeviceAPIClient:
         self._token: Optional[AuthToken] = None
         self._client = httpx.Client(timeout=timeout)
 
+        # (expires_at, data) entries for get_content / get_device_info
+        self._cache_lock = threading.Lock()
+        self._content_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._device_info_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+
+        # ETag of the last playlist response, for conditional polling
+        self.playlist_etag: Optional[str] = None
+
     @property
     def is_authenticated(self) -> bool:
         """Check if device is authenticated with valid token."""
@@ -130,22 +191,19 @@ class DeviceAPIClient:
         """
         self.ensure_authenticated()
 
-        payload = {
-            "cpu_usage_percent": cpu_percent,
-            "memory_usage_percent": memory_percent,
-            "storage_used_gb": storage_used_gb,
-            "temperature_celsius": temperature_celsius,
-            "bandwidth_mbps": bandwidth_mbps,
-            "latency_ms": latency_ms,
-            "current_playlist_id": current_playlist_id,
-            "current_asset_id": current_asset_id,
-            "playback_position_sec": playback_position_sec,
-            "firmware_version": firmware_version,
-            "client_version": client_version,
-        }
-
-        # Remove None values
-        payload = {k: v for k, v in payload.items() if v is not None}
+        payload = _build_heartbeat_payload(
+            cpu_percent,
+            memory_percent,
+            storage_used_gb,
+            temperature_celsius,
+            bandwidth_mbps,
+            latency_ms,
+            current_playlist_id,
+            current_asset_id,
+            playback_position_sec,
+            firmware_version,
+            client_version,
+        )
 
         response = self._client.post(
             f"{self.api_base_url}/api/v1/devices/{self._token.device_id}/heartbeat",
@@ -160,12 +218,20 @@ class DeviceAPIClient:
         """
         Get device information from backend.
 
+        Results are cached in memory for LOOKUP_CACHE_TTL_SEC; each call
+        returns a copy, so callers may modify it freely.
+
         Returns:
             Device information
 
         Raises:
             httpx.HTTPError: If request fails
         """
+        with self._cache_lock:
+            cached = self._device_info_cache
+            if cached is not None and cached[0] > time.monotonic():
+                return copy.deepcopy(cached[1])
+
         self.ensure_authenticated()
 
         response = self._client.get(
@@ -174,37 +240,57 @@ class DeviceAPIClient:
         )
         response.raise_for_status()
 
-        return response.json()
+        data = response.json()
+        with self._cache_lock:
+            self._device_info_cache = (time.monotonic() + LOOKUP_CACHE_TTL_SEC, data)
+        return copy.deepcopy(data)
 
-    def get_assigned_playlist(self) -> Optional[Dict[str, Any]]:
+    def get_assigned_playlist(
+        self, if_none_match: Optional[str] = None, raw: bool = False
+    ) -> Union[Dict[str, Any], bytes, None]:
         """
         Get the currently assigned playlist for this device.
 
+        The response's ETag is kept in playlist_etag.
+
+        Args:
+            if_none_match: ETag of the playlist the caller already has
+            raw: Return the undecoded JSON body, for callers with their
+                own decoder
+
         Returns:
-            Playlist data or None if no playlist assigned
+            Playlist data (JSON bytes if raw), None if no playlist assigned,
+            or PLAYLIST_NOT_MODIFIED if it still matches if_none_match
 
         Raises:
             httpx.HTTPError: If request fails
         """
         self.ensure_authenticated()
 
-        try:
-            response = self._client.get(
-                f"{self.api_base_url}/api/v1/devices/{self._token.device_id}/playlists",
-                headers=self.auth_headers,
-            )
-            if response.status_code == 404:
-                return None
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPError as e:
-            logger.warning(f"Failed to get playlist: {e}")
+        headers = self.auth_headers
+        if if_none_match:
+            headers["If-None-Match"] = if_none_match
+
+        response = self._client.get(
+            f"{self.api_base_url}/api/v1/devices/{self._token.device_id}/playlists",
+            headers=headers,
+        )
+        if response.status_code == 304:
+            return PLAYLIST_NOT_MODIFIED
+        if response.status_code == 404:
+            self.playlist_etag = None
             return None
+        response.raise_for_status()
+        self.playlist_etag = response.headers.get("etag")
+        return response.content if raw else response.json()
 
     def get_content(self, asset_id: str) -> Optional[Dict[str, Any]]:
         """
         Get content/asset information from backend.
 
+        Found assets are cached in memory for LOOKUP_CACHE_TTL_SEC; each
+        call returns a copy, so callers may modify it freely.
+
         Args:
             asset_id: Asset ID to fetch
 
@@ -214,6 +300,14 @@ class DeviceAPIClient:
         Raises:
             httpx.HTTPError: If request fails
         """
+        with self._cache_lock:
+            cached = self._content_cache.get(asset_id)
+            if cached is not None:
+                if cached[0] > time.monotonic():
+                    self._content_cache.move_to_end(asset_id)
+                    return copy.deepcopy(cached[1])
+                del self._content_cache[asset_id]
+
         self.ensure_authenticated()
 
         try:
@@ -224,17 +318,38 @@ class DeviceAPIClient:
             if response.status_code == 404:
                 return None
             response.raise_for_status()
-            return response.json()
+            data = response.json()
         except httpx.HTTPError as e:
             logger.warning(f"Failed to get asset {asset_id}: {e}")
             return None
 
+        with self._cache_lock:
+            self._content_cache[asset_id] = (time.monotonic() + LOOKUP_CACHE_TTL_SEC, data)
+            self._content_cache.move_to_end(asset_id)
+            while len(self._content_cache) > LOOKUP_CACHE_MAX_SIZE:
+                self._content_cache.popitem(last=False)
+        return copy.deepcopy(data)
+
+    def refresh(self, asset_id: Optional[str] = None) -> None:
+        """
+        Invalidate cached asset/device lookups.
+
+        Args:
+            asset_id: Only invalidate this asset. If None, clear everything.
+        """
+        with self._cache_lock:
+            if asset_id is not None:
+                self._content_cache.pop(asset_id, None)
+            else:
+                self._content_cache.clear()
+                self._device_info_cache = None
+
     def download_content(
         self,
         file_path: str,
         destination: Path,
         progress_callback: Optional[callable] = None,
-    ) -> Path:
+    ) -> Tuple[Path, Optional[str]]:
         """
         Download content file from backend.
 
@@ -244,7 +359,7 @@ class DeviceAPIClient:
             progress_callback: Optional callback for download progress
 
         Returns:
-            Path to downloaded file
+            Tuple of (path to downloaded file, server-provided SHA256 or None)
 
         Raises:
             httpx.HTTPError: If download fails
@@ -259,17 +374,33 @@ class DeviceAPIClient:
         with self._client.stream("GET", url, headers=self.auth_headers) as response:
             response.raise_for_status()
             total_size = int(response.headers.get("content-length", 0))
-
-            with open(destination, "wb") as f:
+            checksum = response.headers.get("x-content-sha256")
+
+            # Unencoded bodies can be written straight from the socket buffers;
+            # only compressed responses need httpx's decoding layer
+            encoding = response.headers.get("content-encoding", "identity").lower()
+            if encoding == "identity":
+                chunks = response.iter_raw(chunk_size=DOWNLOAD_CHUNK_SIZE)
+            else:
+                chunks = response.iter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE)
+
+            with open(destination, "wb", buffering=0) as f:
+                if total_size > 0 and encoding == "identity" and hasattr(os, "posix_fallocate"):
+                    try:
+                        os.posix_fallocate(f.fileno(), 0, total_size)
+                    except OSError:
+                        pass
                 downloaded = 0
-                for chunk in response.iter_bytes(chunk_size=8192):
+                for chunk in chunks:
                     f.write(chunk)
                     downloaded += len(chunk)
                     if progress_callback and total_size > 0:
                         progress_callback(downloaded / total_size)
+                # Drop any preallocated tail if the body came up short
+                f.truncate(downloaded)
 
         logger.info(f"Downloaded content to {destination}")
-        return destination
+        return destination, checksum.lower() if checksum else None
 
     def poll_commands(self, last_command_id: Optional[str] = None) -> list[Dict[str, Any]]:
         """
@@ -296,6 +427,7 @@ class DeviceAPIClient:
         success: bool,
         result: Optional[str] = None,
         error: Optional[str] = None,
+        asset_id: Optional[str] = None,
     ) -> None:
         """
         Report command execution result to backend.
@@ -305,6 +437,9 @@ class DeviceAPIClient:
             success: Whether command succeeded
             result: Optional result message
             error: Optional error message
+            asset_id: Asset the command acted on, if any. Only that asset's
+                cached lookup is invalidated; otherwise only the cached
+                device info is.
 
         Raises:
             httpx.HTTPError: If report fails
@@ -325,6 +460,13 @@ class DeviceAPIClient:
         )
         response.raise_for_status()
 
+        # The command may have changed the asset it targeted or device state
+        if asset_id is not None:
+            self.refresh(asset_id)
+        else:
+            with self._cache_lock:
+                self._device_info_cache = None
+
         logger.info(f"Reported command result for {command_id}: {success}")
 
     def close(self) -> None:
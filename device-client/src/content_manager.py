@@ -5,13 +5,20 @@ Handles content downloading, caching, and management for holographic displays.
 Compatible with Looking Glass Factory quilt formats and standard 3D formats.
 """
 import os
+import time
 import hashlib
 import logging
 import json
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime
+
+# Optional msgspec for fast metadata (de)serialization
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
 
 
 logger = logging.getLogger(__name__)
@@ -25,11 +32,47 @@ class CachedContent:
     file_path: Path
     content_type: str
     file_size: int
-    downloaded_at: datetime
-    last_accessed: datetime
+    downloaded_at: float  # Unix timestamp
+    last_accessed: float  # Unix timestamp
     checksum: str
     metadata: Dict[str, Any]
 
+    @property
+    def downloaded_datetime(self) -> datetime:
+        """Download time as a datetime."""
+        return datetime.fromtimestamp(self.downloaded_at)
+
+    @property
+    def last_accessed_datetime(self) -> datetime:
+        """Last access time as a datetime."""
+        return datetime.fromtimestamp(self.last_accessed)
+
+
+def _to_timestamp(value: Any) -> float:
+    """Convert a stored timestamp to unix seconds (accepts legacy ISO strings)."""
+    if isinstance(value, str):
+        return datetime.fromisoformat(value).timestamp()
+    return float(value)
+
+
+def _msgspec_dec_hook(type_: type, obj: Any) -> Any:
+    """Decode types msgspec does not handle natively."""
+    if type_ is Path:
+        return Path(obj)
+    raise NotImplementedError(f"Unsupported type: {type_}")
+
+
+def _msgspec_enc_hook(obj: Any) -> Any:
+    """Encode types msgspec does not handle natively."""
+    if isinstance(obj, Path):
+        return str(obj)
+    raise NotImplementedError(f"Unsupported type: {type(obj)}")
+
+
+if msgspec is not None:
+    _metadata_decoder = msgspec.json.Decoder(Dict[str, CachedContent], dec_hook=_msgspec_dec_hook)
+    _metadata_encoder = msgspec.json.Encoder(enc_hook=_msgspec_enc_hook)
+
 
 class ContentManager:
     """
@@ -60,12 +103,21 @@ class ContentManager:
     def _load_metadata(self) -> None:
         """Load cache metadata from disk."""
         if self.metadata_file.exists():
+            if msgspec is not None:
+                try:
+                    self.metadata = _metadata_decoder.decode(self.metadata_file.read_bytes())
+                    logger.info(f"Loaded metadata for {len(self.metadata)} cached items")
+                    return
+                except (msgspec.DecodeError, OSError) as e:
+                    # Legacy formats (e.g. ISO timestamps) go through the stdlib path
+                    logger.debug(f"Fast metadata decode failed, falling back to json: {e}")
+
             try:
                 with open(self.metadata_file, "r") as f:
                     data = json.load(f)
                     for asset_id, cached in data.items():
-                        cached["downloaded_at"] = datetime.fromisoformat(cached["downloaded_at"])
-                        cached["last_accessed"] = datetime.fromisoformat(cached["last_accessed"])
+                        cached["downloaded_at"] = _to_timestamp(cached["downloaded_at"])
+                        cached["last_accessed"] = _to_timestamp(cached["last_accessed"])
                         cached["file_path"] = Path(cached["file_path"])
                         self.metadata[asset_id] = CachedContent(**cached)
                 logger.info(f"Loaded metadata for {len(self.metadata)} cached items")
@@ -75,6 +127,10 @@ class ContentManager:
     def _save_metadata(self) -> None:
         """Save cache metadata to disk."""
         try:
+            if msgspec is not None:
+                self.metadata_file.write_bytes(_metadata_encoder.encode(self.metadata))
+                return
+
             data = {}
             for asset_id, cached in self.metadata.items():
                 data[asset_id] = {
@@ -82,8 +138,8 @@ class ContentManager:
                     "file_path": str(cached.file_path),
                     "content_type": cached.content_type,
                     "file_size": cached.file_size,
-                    "downloaded_at": cached.downloaded_at.isoformat(),
-                    "last_accessed": cached.last_accessed.isoformat(),
+                    "downloaded_at": cached.downloaded_at,
+                    "last_accessed": cached.last_accessed,
                     "checksum": cached.checksum,
                     "metadata": cached.metadata,
                 }
@@ -142,7 +198,7 @@ class ContentManager:
         if self.is_cached(asset_id):
             cached = self.metadata[asset_id]
             # Update last accessed time
-            cached.last_accessed = datetime.now()
+            cached.last_accessed = time.time()
             self._save_metadata()
             return cached
         return None
@@ -173,13 +229,14 @@ class ContentManager:
         shutil.copy2(source_path, cache_path)
 
         # Create metadata
+        now = time.time()
         cached = CachedContent(
             asset_id=asset_id,
             file_path=cache_path,
             content_type=content_type,
             file_size=cache_path.stat().st_size,
-            downloaded_at=datetime.now(),
-            last_accessed=datetime.now(),
+            downloaded_at=now,
+            last_accessed=now,
             checksum=self._calculate_checksum(cache_path),
             metadata=metadata or {},
         )
@@ -196,6 +253,7 @@ class ContentManager:
         asset_id: str,
         asset_data: Optional[Dict[str, Any]] = None,
         progress_callback: Optional[callable] = None,
+        verify_checksum: bool = False,
     ) -> Optional[CachedContent]:
         """
         Download content from backend.
@@ -205,6 +263,8 @@ class ContentManager:
             asset_id: Asset ID
             asset_data: Optional asset data from API
             progress_callback: Optional progress callback
+            verify_checksum: Re-hash the downloaded file even if the server
+                provided a checksum
 
         Returns:
             CachedContent if successful, None otherwise
@@ -226,21 +286,32 @@ class ContentManager:
                 logger.error(f"Asset {asset_id} has no file_path")
                 return None
 
-            api_client.download_content(
+            _, checksum = api_client.download_content(
                 file_path=file_path,
                 destination=cache_path,
                 progress_callback=progress_callback,
             )
 
+            # Trust the server-provided digest unless asked to verify
+            if checksum is None:
+                checksum = self._calculate_checksum(cache_path)
+            elif verify_checksum:
+                actual = self._calculate_checksum(cache_path)
+                if actual != checksum:
+                    logger.error(f"Checksum mismatch for asset {asset_id}: expected {checksum}, got {actual}")
+                    cache_path.unlink(missing_ok=True)
+                    return None
+
             # Create cached metadata
+            now = time.time()
             cached = CachedContent(
                 asset_id=asset_id,
                 file_path=cache_path,
                 content_type=content_type,
                 file_size=cache_path.stat().st_size,
-                downloaded_at=datetime.now(),
-                last_accessed=datetime.now(),
-                checksum=self._calculate_checksum(cache_path),
+                downloaded_at=now,
+                last_accessed=now,
+                checksum=checksum,
                 metadata=asset_data,
             )
 
@@ -269,6 +340,33 @@ class ContentManager:
             return cached.file_path
         return None
 
+    def get_content_for_display_batch(self, asset_ids: List[str]) -> List[Optional[Path]]:
+        """
+        Get content file paths for several assets at once.
+
+        Access times are updated for all found assets with a single
+        metadata write.
+
+        Args:
+            asset_ids: Asset IDs
+
+        Returns:
+            Paths in the same order as asset_ids, None for assets not available
+        """
+        now = time.time()
+        paths: List[Optional[Path]] = []
+        for asset_id in asset_ids:
+            if self.is_cached(asset_id):
+                cached = self.metadata[asset_id]
+                cached.last_accessed = now
+                paths.append(cached.file_path)
+            else:
+                paths.append(None)
+
+        if any(path is not None for path in paths):
+            self._save_metadata()
+        return paths
+
     def cleanup_old_content(self, max_age_days: int = 30) -> int:
         """
         Clean up old content from cache.
@@ -279,7 +377,7 @@ class ContentManager:
         Returns:
             Number of items cleaned up
         """
-        cutoff = datetime.now() - timedelta(days=max_age_days)
+        cutoff = time.time() - max_age_days * 86400
         to_remove = []
 
         for asset_id, cached in self.metadata.items():
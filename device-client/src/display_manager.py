@@ -5,17 +5,26 @@ Handles holographic display output.
 Compatible with Looking Glass Factory displays.
 Supports simulation mode for testing without hardware.
 """
+import asyncio
+import colorsys
+import ctypes
+import functools
 import logging
+import math
+import queue
+import threading
 import time
-from abc import ABC, abstractmethod
-from typing import Optional, List, Dict, Any
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Callable, Protocol, Set, Tuple
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
 # Optional OpenGL imports - only available if pyglet is installed
 try:
     import pyglet
+    from pyglet.gl import Config as GLConfig
     # Use PyOpenGL for constants (more reliable)
     from OpenGL.GL import (
         GL_DEPTH_TEST, GL_LIGHTING, GL_LIGHT0, GL_COLOR_MATERIAL,
@@ -23,13 +32,18 @@ try:
         GL_AMBIENT, GL_DIFFUSE, GL_PROJECTION, GL_MODELVIEW,
         GL_COLOR_BUFFER_BIT, GL_DEPTH_BUFFER_BIT,
         GL_VERTEX_ARRAY, GL_NORMAL_ARRAY, GL_TRIANGLES, GL_UNSIGNED_INT,
-        GL_TRUE, GL_FALSE, GL_FLOAT, GL_DOUBLE,
+        GL_UNSIGNED_SHORT, GL_UNSIGNED_BYTE, GL_TRUE, GL_FALSE, GL_FLOAT,
+        GL_COLOR_ARRAY, GL_ARRAY_BUFFER, GL_ELEMENT_ARRAY_BUFFER, GL_STATIC_DRAW,
         glEnable, glDisable, glLightfv, glClearColor,
-        glMatrixMode, glLoadIdentity, glRotatef,
+        glMatrixMode, glLoadIdentity, glRotatef, glMultMatrixf,
+        glPushMatrix, glPopMatrix, glViewport,
         glEnableClientState, glDisableClientState,
-        glVertexPointer, glNormalPointer, glDrawElements, glDrawArrays,
+        glVertexPointer, glNormalPointer, glColorPointer, glDrawElements, glDrawArrays,
+        glGenBuffers, glBindBuffer, glBufferData, glDeleteBuffers,
+        GL_COMPILE, glGenLists, glNewList, glEndList, glCallList, glDeleteLists,
+        GL_PIXEL_PACK_BUFFER, GL_STREAM_READ, GL_READ_ONLY, GL_RGBA,
+        glReadPixels, glMapBuffer, glUnmapBuffer,
         glFlush, glClear,
-        glBegin, glEnd, glNormal3f, glColor3f, glVertex3f,
     )
     from OpenGL.GLU import gluPerspective, gluLookAt
     PYGLET_AVAILABLE = True
@@ -37,9 +51,91 @@ except ImportError:
     PYGLET_AVAILABLE = False
     pyglet = None
 
+# Optional mesh loading - only needed for real 3D mode
+try:
+    import numpy as np
+    import trimesh
+    TRIMESH_AVAILABLE = True
+except ImportError:
+    TRIMESH_AVAILABLE = False
+    np = None
+    trimesh = None
+
+# Optional Looking Glass SDK - only needed for real hardware
+try:
+    from looking_glass import LookingGlassDisplay
+    LOOKING_GLASS_AVAILABLE = True
+except ImportError:
+    LOOKING_GLASS_AVAILABLE = False
+    LookingGlassDisplay = None
+
+# Optional Numba JIT for mesh bounds - falls back to numpy reductions
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    njit = None
+
 
 logger = logging.getLogger(__name__)
 
+# Number of items the Looking Glass backend may load ahead of display
+PRELOAD_DEPTH = 2
+
+# Compiled scenes the real-3D backend keeps for repeat shows
+SCENE_CACHE_SIZE = 8
+
+# Banner separator for simulation log output
+_SEP = "=" * 60
+
+# Real-3D vertex layout: float32 xyz followed by normalized uint8 rgba
+_VERTEX_STRIDE = 16
+_VERTEX_COLOR_OFFSET = 12
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _accumulate_bounds(vertices, lo, hi):
+        """Fold the min/max of an (n, 3) vertex array into lo/hi in one pass."""
+        for i in range(vertices.shape[0]):
+            for axis in range(3):
+                value = vertices[i, axis]
+                if value < lo[axis]:
+                    lo[axis] = value
+                if value > hi[axis]:
+                    hi[axis] = value
+else:
+    def _accumulate_bounds(vertices, lo, hi):
+        """Fold the min/max of an (n, 3) vertex array into lo/hi."""
+        if len(vertices):
+            np.minimum(lo, vertices.min(axis=0), out=lo)
+            np.maximum(hi, vertices.max(axis=0), out=hi)
+
+
+@functools.lru_cache(maxsize=1)
+def _vertex_dtype():
+    """numpy dtype matching the real-3D vertex layout."""
+    return np.dtype({
+        "names": ["position", "color"],
+        "formats": [(np.float32, 3), (np.uint8, 4)],
+        "offsets": [0, _VERTEX_COLOR_OFFSET],
+        "itemsize": _VERTEX_STRIDE,
+    })
+
+
+@functools.lru_cache(maxsize=256)
+def _path_mtime_ns(path_str: str, epoch: int) -> Optional[int]:
+    """
+    Return a file's mtime in ns, or None if it does not exist or can't be stat'ed.
+
+    Callers pass int(time.monotonic()) as epoch so results expire every second.
+    """
+    try:
+        return Path(path_str).stat().st_mtime_ns
+    except OSError:
+        return None
+
 
 class DisplayType(Enum):
     """Supported display types."""
@@ -52,7 +148,7 @@ class DisplayType(Enum):
     WEB_EMULATOR = "web_emulator"
 
 
-@dataclass
+@dataclass(slots=True)
 class DisplayConfig:
     """Display configuration."""
 
@@ -63,9 +159,10 @@ class DisplayConfig:
     brightness: int = 80
     volume: int = 50
     orientation: str = "portrait"  # portrait or landscape
+    sdk_handle_pool_size: int = 8  # Loaded assets kept resident in the SDK
 
 
-@dataclass
+@dataclass(slots=True)
 class ContentItem:
     """Content item for display."""
 
@@ -73,60 +170,111 @@ class ContentItem:
     file_path: Path
     content_type: str
     duration: Optional[int] = None  # Duration in seconds
-    metadata: Dict[str, Any] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    # str(file_path), computed once for SDK calls
+    _file_path_str: str = field(init=False, default="", repr=False, compare=False)
 
     def __post_init__(self):
-        if self.metadata is None:
-            self.metadata = {}
+        self._file_path_str = str(self.file_path)
+
 
+def _show_sequence(backend: Any, contents: List[ContentItem]) -> List[bool]:
+    """
+    Show content items in order on a backend, each for its duration.
 
-class DisplayBackend(ABC):
-    """Abstract base class for display backends."""
+    The next item is preloaded while the current one is on screen, if the
+    backend supports preloading.
+
+    Returns:
+        Success flag per item
+    """
+    preload = getattr(backend, "preload", None)
+    results = []
+    for i, content in enumerate(contents):
+        results.append(backend.show_content(content))
+        if i + 1 < len(contents) and preload is not None:
+            preload(contents[i + 1])
+        # The last item gets its full display time too, so callers looping
+        # over batches don't cut it short
+        if results[-1] and content.duration:
+            time.sleep(content.duration)
+    return results
+
+
+class DisplayBackend(Protocol):
+    """
+    Interface for display backends.
+
+    Any object with the five core methods (initialize, show_content, clear,
+    set_brightness, shutdown) can be registered as a backend; DisplayManager
+    falls back to the defaults below when preload, is_busy or show_contents
+    is missing. The built-in backends subclass this to inherit them.
+    """
 
-    @abstractmethod
     def initialize(self) -> bool:
         """Initialize display. Return True if successful."""
-        pass
+        ...
 
-    @abstractmethod
     def show_content(self, content: ContentItem) -> bool:
         """Show content on display. Return True if successful."""
-        pass
+        ...
 
-    @abstractmethod
     def clear(self) -> None:
         """Clear display."""
-        pass
+        ...
 
-    @abstractmethod
     def set_brightness(self, brightness: int) -> None:
         """Set display brightness (0-100)."""
-        pass
+        ...
 
-    @abstractmethod
     def shutdown(self) -> None:
         """Shutdown display."""
+        ...
+
+    def preload(self, content: ContentItem) -> None:
+        """Prepare content ahead of display. Optional; default does nothing."""
         pass
 
+    def is_busy(self) -> bool:
+        """Return True while the current content's display time is running."""
+        return False
+
+    def show_contents(self, contents: List[ContentItem]) -> List[bool]:
+        """
+        Show a sequence of content items, each for its duration.
+
+        The next item is preloaded while the current one is on screen.
+
+        Returns:
+            Success flag per item
+        """
+        return _show_sequence(self, contents)
+
 
 class SimulationDisplayBackend(DisplayBackend):
     """
     Simulation display backend for testing without hardware.
 
     Logs what would be displayed on real hardware.
+
+    show_content returns immediately; callers that need to wait for the
+    simulated display time should poll is_busy() or await
+    show_content_async().
     """
 
     def __init__(self, config: DisplayConfig):
         self.config = config
         self.current_content: Optional[ContentItem] = None
         self._initialized = False
+        self._display_until: float = 0.0
+        self._display_type_str = config.display_type.value
 
     def initialize(self) -> bool:
         """Initialize simulation display."""
-        logger.info(f"Initializing simulation display: {self.config.display_type.value}")
-        logger.info(f"  Resolution: {self.config.resolution[0]}x{self.config.resolution[1]}")
-        logger.info(f"  Quilt views: {self.config.quilt_views}, depth: {self.config.quilt_depth}")
-        logger.info(f"  Brightness: {self.config.brightness}%")
+        logger.info("Initializing simulation display: %s", self._display_type_str)
+        logger.info("  Resolution: %dx%d", self.config.resolution[0], self.config.resolution[1])
+        logger.info("  Quilt views: %s, depth: %s", self.config.quilt_views, self.config.quilt_depth)
+        logger.info("  Brightness: %d%%", self.config.brightness)
         self._initialized = True
         return True
 
@@ -136,41 +284,71 @@ class SimulationDisplayBackend(DisplayBackend):
             logger.error("Display not initialized")
             return False
 
-        logger.info("=" * 60)
-        logger.info(f"DISPLAYING CONTENT: {content.asset_id}")
-        logger.info(f"  File: {content.file_path}")
-        logger.info(f"  Type: {content.content_type}")
-        logger.info(f"  Duration: {content.duration or 'Loop'}")
-        if content.metadata:
-            logger.info(f"  Metadata: {content.metadata}")
-        logger.info("=" * 60)
-
+        current = self.current_content
         self.current_content = content
 
         # Simulate display duration
         if content.duration:
-            logger.info(f"  Displaying for {content.duration} seconds...")
-            time.sleep(min(content.duration, 5))  # Max 5 seconds in sim mode
+            self._display_until = time.monotonic() + min(content.duration, 5)  # Max 5 seconds in sim mode
         else:
-            logger.info(f"  Displaying (loop mode)...")
+            self._display_until = 0.0
+
+        if (
+            current is not None
+            and current.asset_id == content.asset_id
+            and current.file_path == content.file_path
+        ):
+            logger.debug("Continuing to display: %s", content.asset_id)
+        elif logger.isEnabledFor(logging.INFO):
+            # One record for the whole banner instead of one per line
+            lines = [
+                _SEP,
+                f"DISPLAYING CONTENT: {content.asset_id}",
+                f"  File: {content.file_path}",
+                f"  Type: {content.content_type}",
+                f"  Duration: {content.duration or 'Loop'}",
+            ]
+            if content.metadata:
+                lines.append(f"  Metadata: {content.metadata}")
+            lines.append(_SEP)
+            if content.duration:
+                lines.append(f"  Displaying for {content.duration} seconds...")
+            else:
+                lines.append("  Displaying (loop mode)...")
+            logger.info("\n".join(lines))
 
         return True
 
+    async def show_content_async(self, content: ContentItem) -> bool:
+        """Show content and wait out its simulated display time."""
+        if not self.show_content(content):
+            return False
+        remaining = self._display_until - time.monotonic()
+        if remaining > 0:
+            await asyncio.sleep(remaining)
+        return True
+
+    def is_busy(self) -> bool:
+        """Return True while the simulated display time is running."""
+        return time.monotonic() < self._display_until
+
     def clear(self) -> None:
         """Clear display."""
         logger.info("Clearing display")
         self.current_content = None
+        self._display_until = 0.0
 
     def set_brightness(self, brightness: int) -> None:
         """Set display brightness."""
-        logger.info(f"Setting brightness to {brightness}%")
-        self.config.brightness = max(0, min(100, brightness))
+        logger.info("Setting brightness to %d%%", brightness)
+        self.config.brightness = 0 if brightness < 0 else 100 if brightness > 100 else brightness
 
     def shutdown(self) -> None:
         """Shutdown display."""
         logger.info("Shutting down simulation display")
         self._initialized = False
         self.current_content = None
+        self._display_until = 0.0
 
 
 class LookingGlassDisplayBackend(DisplayBackend):
@@ -188,14 +366,37 @@ class LookingGlassDisplayBackend(DisplayBackend):
         self.current_content: Optional[ContentItem] = None
         self._display = None
         self._initialized = False
-
-        # Try to import Looking Glass SDK
-        try:
-            from looking_glass import LookingGlassDisplay
-            self._lg_sdk = LookingGlassDisplay
-        except ImportError:
+        self._display_type_str = config.display_type.value
+
+        # content_type -> SDK loader, built once the SDK display exists
+        self._type_dispatch: Dict[str, Optional[Callable[[str], Any]]] = {}
+
+        # (asset_id, file_path, mtime_ns) of the content currently loaded in
+        # the SDK; repeat shows of the same content only re-render
+        self._loaded_key: Optional[Tuple[str, Path, int]] = None
+
+        # Background loading: content is loaded into the SDK on a worker
+        # thread while the current item is on screen; render stays on the
+        # calling thread. Loads are keyed like _loaded_key, so a handle for an
+        # older version of a file is never bound.
+        self._async_load = False
+        self._load_queue: "queue.Queue[Optional[Tuple[Tuple[str, Path, int], ContentItem]]]" = (
+            queue.Queue(maxsize=PRELOAD_DEPTH)
+        )
+        self._loader_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._preload_cond = threading.Condition()
+        self._preloaded: Dict[Tuple[str, Path, int], Tuple[Any, Optional[Exception]]] = {}
+        self._in_flight: Set[Tuple[str, Path, int]] = set()
+
+        # Loaded SDK handles by asset_id (LRU), so revisiting an asset is a
+        # bind instead of a re-upload; bounded to limit GPU memory
+        self._handle_pool: "OrderedDict[str, Tuple[Tuple[str, Path, int], Any]]" = OrderedDict()
+        self._pool_capacity = max(1, config.sdk_handle_pool_size)
+
+        self._lg_sdk = LookingGlassDisplay
+        if not LOOKING_GLASS_AVAILABLE:
             logger.warning("Looking Glass SDK not installed. Install with: pip install lookingglass")
-            self._lg_sdk = None
 
     def initialize(self) -> bool:
         """Initialize Looking Glass display."""
@@ -204,19 +405,176 @@ class LookingGlassDisplayBackend(DisplayBackend):
             return False
 
         try:
-            logger.info(f"Initializing Looking Glass display: {self.config.display_type.value}")
+            logger.info("Initializing Looking Glass display: %s", self._display_type_str)
             self._display = self._lg_sdk(
                 resolution=self.config.resolution,
                 quilt_views=self.config.quilt_views,
                 quilt_depth=self.config.quilt_depth,
             )
             self._display.initialize()
+
+            self._type_dispatch = {
+                "model/glb": self._display.load_model,
+                # Quilt files (pre-rendered holographic image sequences)
+                "quilt/png": self._display.load_quilt,
+                "quilt/jpg": self._display.load_quilt,
+                "quilt/sequence": self._display.load_quilt,
+            }
+
+            # Loading ahead needs an SDK that can hold several loaded assets
+            # and switch the active one
+            self._async_load = callable(getattr(self._display, "bind", None))
+            if self._async_load:
+                self._stop_event.clear()
+                self._loader_thread = threading.Thread(
+                    target=self._loader_loop,
+                    name="lg-content-loader",
+                    daemon=True,
+                )
+                self._loader_thread.start()
+
             self._initialized = True
             return True
         except Exception as e:
-            logger.error(f"Failed to initialize Looking Glass display: {e}")
+            logger.error("Failed to initialize Looking Glass display: %s", e)
             return False
 
+    def _loader_for(self, content_type: str) -> Optional[Callable[[str], Any]]:
+        """Return the SDK loader for a content type, or None if unsupported."""
+        try:
+            return self._type_dispatch[content_type]
+        except KeyError:
+            pass
+        # Other quilt variants load as quilts; remember the answer either way
+        # so unsupported types are not re-examined on every show
+        loader = self._display.load_quilt if content_type.startswith("quilt") else None
+        self._type_dispatch[content_type] = loader
+        return loader
+
+    def _load(self, content: ContentItem) -> Any:
+        """Load content into the SDK and return its handle."""
+        return self._loader_for(content.content_type)(content._file_path_str)
+
+    def _content_key(self, content: ContentItem) -> Optional[Tuple[str, Path, int]]:
+        """Return (asset_id, file_path, mtime_ns) for content, or None if its file is missing."""
+        # stat cached for up to a second
+        mtime_ns = _path_mtime_ns(content._file_path_str, int(time.monotonic()))
+        if mtime_ns is None:
+            return None
+        return (content.asset_id, content.file_path, mtime_ns)
+
+    def _pop_stale_preloads(self, key: Tuple[str, Path, int]) -> List[Any]:
+        """Remove other versions of key's asset from _preloaded; caller holds _preload_cond."""
+        stale = [k for k in self._preloaded if k[0] == key[0] and k != key]
+        return [self._preloaded.pop(k)[0] for k in stale]
+
+    def _loader_loop(self) -> None:
+        """Worker thread: load queued content into the SDK."""
+        while not self._stop_event.is_set():
+            queued = self._load_queue.get()
+            if queued is None:
+                break
+            key, content = queued
+
+            try:
+                result = (self._load(content), None)
+            except Exception as e:
+                result = (None, e)
+
+            with self._preload_cond:
+                self._in_flight.discard(key)
+                evicted = self._pop_stale_preloads(key)
+                self._preloaded[key] = result
+                # Drop the oldest never-shown results
+                while len(self._preloaded) > PRELOAD_DEPTH:
+                    evicted.append(self._preloaded.pop(next(iter(self._preloaded)))[0])
+                self._preload_cond.notify_all()
+
+            for handle in evicted:
+                self._unload(handle)
+
+    def _unload(self, handle: Any) -> None:
+        """Release an SDK handle if the SDK supports it."""
+        if handle is None:
+            return
+        unload = getattr(self._display, "unload", None)
+        if callable(unload):
+            try:
+                unload(handle)
+            except Exception as e:
+                logger.debug("Failed to unload SDK handle: %s", e)
+
+    def preload(self, content: ContentItem) -> None:
+        """
+        Queue content to be loaded in the background ahead of display.
+
+        No-op if the SDK cannot hold more than one loaded asset.
+        """
+        if not self._async_load or self._loader_for(content.content_type) is None:
+            return
+
+        key = self._content_key(content)
+        if key is None:
+            return
+
+        # Already resident in the SDK
+        pooled = self._handle_pool.get(content.asset_id)
+        if pooled is not None and pooled[0] == key:
+            return
+
+        with self._preload_cond:
+            if key in self._in_flight or key in self._preloaded:
+                return
+            self._in_flight.add(key)
+
+        try:
+            self._load_queue.put_nowait((key, content))
+        except queue.Full:
+            # Loader is behind; this item will be loaded on show instead
+            with self._preload_cond:
+                self._in_flight.discard(key)
+
+    def _take_preloaded(self, key: Tuple[str, Path, int]) -> Any:
+        """Wait for and return a background-loaded handle, or None if not queued."""
+        with self._preload_cond:
+            while key in self._in_flight:
+                self._preload_cond.wait()
+            result = self._preloaded.pop(key, None)
+            # Versions of this asset other than the one being shown are stale
+            stale = self._pop_stale_preloads(key)
+
+        for handle in stale:
+            self._unload(handle)
+        if result is None:
+            return None
+        handle, error = result
+        if error is not None:
+            raise error
+        return handle
+
+    def _bind_content(self, content: ContentItem, key: Tuple[str, Path, int]) -> None:
+        """Bind content's SDK handle, loading it if it is not in the pool."""
+        pooled = self._handle_pool.get(content.asset_id)
+        if pooled is not None and pooled[0] == key:
+            self._handle_pool.move_to_end(content.asset_id)
+            self._display.bind(pooled[1])
+            return
+
+        # Use the background-loaded handle if this item was preloaded
+        handle = self._take_preloaded(key)
+        if handle is None:
+            handle = self._load(content)
+        self._display.bind(handle)
+
+        # Replace a stale handle for the same asset, then evict LRU entries
+        if pooled is not None:
+            self._unload(pooled[1])
+        self._handle_pool[content.asset_id] = (key, handle)
+        self._handle_pool.move_to_end(content.asset_id)
+        while len(self._handle_pool) > self._pool_capacity:
+            _, (_, old_handle) = self._handle_pool.popitem(last=False)
+            self._unload(old_handle)
+
     def show_content(self, content: ContentItem) -> bool:
         """Show content on Looking Glass display."""
         if not self._initialized or self._display is None:
@@ -225,31 +583,30 @@ class LookingGlassDisplayBackend(DisplayBackend):
 
         try:
             # Check if file exists
-            if not content.file_path.exists():
-                logger.error(f"Content file not found: {content.file_path}")
+            key = self._content_key(content)
+            if key is None:
+                logger.error("Content file not found: %s", content.file_path)
                 return False
 
-            # Display based on content type
-            if content.content_type == "model/glb":
-                # Load and display GLB model
-                self._display.load_model(str(content.file_path))
-                self._display.render()
+            if self._loader_for(content.content_type) is None:
+                logger.warning("Unsupported content type: %s", content.content_type)
+                return False
 
-            elif content.content_type.startswith("quilt"):
-                # Display quilt file (pre-rendered holographic image sequence)
-                self._display.load_quilt(str(content.file_path))
-                self._display.render()
+            if key != self._loaded_key:
+                if self._async_load:
+                    self._bind_content(content, key)
+                else:
+                    self._load(content)
+                self._loaded_key = key
 
-            else:
-                logger.warning(f"Unsupported content type: {content.content_type}")
-                return False
+            self._display.render()
 
             self.current_content = content
-            logger.info(f"Displaying content: {content.asset_id}")
+            logger.info("Displaying content: %s", content.asset_id)
             return True
 
         except Exception as e:
-            logger.error(f"Failed to show content: {e}")
+            logger.error("Failed to show content: %s", e)
             return False
 
     def clear(self) -> None:
@@ -257,19 +614,46 @@ class LookingGlassDisplayBackend(DisplayBackend):
         if self._display:
             self._display.clear()
         self.current_content = None
+        self._loaded_key = None
 
     def set_brightness(self, brightness: int) -> None:
         """Set display brightness."""
+        brightness = 0 if brightness < 0 else 100 if brightness > 100 else brightness
         if self._display:
-            self._display.set_brightness(max(0, min(100, brightness)))
-        self.config.brightness = max(0, min(100, brightness))
+            self._display.set_brightness(brightness)
+        self.config.brightness = brightness
 
     def shutdown(self) -> None:
         """Shutdown display."""
+        self._stop_loader()
         if self._display:
             self._display.shutdown()
         self._initialized = False
         self.current_content = None
+        self._loaded_key = None
+        self._handle_pool.clear()
+        _path_mtime_ns.cache_clear()
+
+    def _stop_loader(self) -> None:
+        """Stop the background loader and drop pending results."""
+        if self._loader_thread is None:
+            return
+
+        self._stop_event.set()
+        # Drain queued work so the stop sentinel fits
+        while True:
+            try:
+                self._load_queue.get_nowait()
+            except queue.Empty:
+                break
+        self._load_queue.put(None)
+        self._loader_thread.join(timeout=5)
+        self._loader_thread = None
+
+        with self._preload_cond:
+            self._preloaded.clear()
+            self._in_flight.clear()
+            self._preload_cond.notify_all()
 
 
 class Real3DDisplayBackend(DisplayBackend):
@@ -288,60 +672,114 @@ class Real3DDisplayBackend(DisplayBackend):
         self._scene = None
         self._initialized = False
         self._rotation = 0.0
+        self._display_type_str = config.display_type.value
+        # Compiled draw of the current scene
+        self._display_list: Optional[int] = None
+        # (file path, mtime_ns) -> (display list, scene), least recent first
+        self._scene_cache: "OrderedDict[Tuple[str, Optional[int]], Tuple[int, Any]]" = OrderedDict()
+        self._window_visible = True
+        self._view_pushed = False
+        # Column-major Y rotation, updated in place each frame
+        self._rotation_matrix = (ctypes.c_float * 16)(
+            1, 0, 0, 0,
+            0, 1, 0, 0,
+            0, 0, 1, 0,
+            0, 0, 0, 1,
+        )
+        # Double-buffered pixel readback for capture_frame()
+        self._pbos: List[int] = []
+        self._pbo_size = 0
+        self._capture_count = 0
+        # Pending background model loads, keyed by (asset_id, file path)
+        self._prefetch_pool: Optional[ThreadPoolExecutor] = None
+        self._prefetch_lock = threading.Lock()
+        self._prefetched: "OrderedDict[Tuple[str, int], Any]" = OrderedDict()
 
     def initialize(self) -> bool:
         """Initialize 3D display window."""
+        if not TRIMESH_AVAILABLE:
+            logger.error("Neither pyglet nor trimesh viewer available")
+            return False
+
+        logger.info(f"Initializing 3D display: {self._display_type_str}")
+        logger.info(f"  Resolution: {self.config.resolution[0]}x{self.config.resolution[1]}")
+
+        # Try to create a simple viewer with pyglet
         try:
-            import trimesh
+            if not PYGLET_AVAILABLE:
+                raise ImportError("pyglet not available")
+
+            # Create window with OpenGL config for compatibility profile
+            config = GLConfig(
+                double_buffer=True,
+                depth_size=24,
+                major_version=2,
+                minor_version=1,
+                forward_compatible=False,
+            )
 
-            logger.info(f"Initializing 3D display: {self.config.display_type.value}")
-            logger.info(f"  Resolution: {self.config.resolution[0]}x{self.config.resolution[1]}")
+            window_width, window_height = self.config.resolution
+            self._window = pyglet.window.Window(
+                width=window_width,
+                height=window_height,
+                caption="HoloHub 3D Display",
+                resizable=False,
+                config=config,
+            )
 
-            # Try to create a simple viewer with pyglet
-            try:
-                if not PYGLET_AVAILABLE:
-                    raise ImportError("pyglet not available")
-
-                # Create window with OpenGL config for compatibility profile
-                from pyglet.gl import Config
-                config = Config(
-                    double_buffer=True,
-                    depth_size=24,
-                    major_version=2,
-                    minor_version=1,
-                    forward_compatible=False,
-                )
+            # Setup basic OpenGL state
+            glEnable(GL_DEPTH_TEST)
+            glClearColor(0.1, 0.1, 0.1, 1.0)
 
-                window_width, window_height = self.config.resolution
-                self._window = pyglet.window.Window(
-                    width=window_width,
-                    height=window_height,
-                    caption="HoloHub 3D Display",
-                    resizable=False,
-                    config=config,
-                )
+            # Camera only changes with the window size
+            self._window.on_resize = self._setup_camera
+            self._setup_camera()
 
-                # Setup basic OpenGL state
-                glEnable(GL_DEPTH_TEST)
-                glClearColor(0.1, 0.1, 0.1, 1.0)
+            # Set up the draw handler for rendering
+            self._window.on_draw = self._render_scene
+            # Nothing is visible while minimized; skip drawing until shown
+            self._window.on_hide = lambda: self._set_window_visible(False)
+            self._window.on_show = lambda: self._set_window_visible(True)
 
-                # Set up the draw handler for rendering
-                self._window.on_draw = self._render_scene
+            self._initialized = True
+            logger.info(f"3D display window initialized: {window_width}x{window_height}")
+            logger.info(f"  OpenGL context created, on_draw handler registered")
 
-                self._initialized = True
-                logger.info(f"3D display window initialized: {window_width}x{window_height}")
-                logger.info(f"  OpenGL context created, on_draw handler registered")
+        except ImportError:
+            logger.warning("pyglet not available, using viewer mode")
+            # Fall back to trimesh viewer if available
+            self._use_viewer_mode()
 
-            except ImportError:
-                logger.warning("pyglet not available, using viewer mode")
-                # Fall back to trimesh viewer if available
-                self._use_viewer_mode()
+        return True
 
-            return True
+    def _setup_camera(self, width: int = 0, height: int = 0):
+        """
+        Set up projection and camera view (pyglet on_resize handler).
 
-        except ImportError:
-            logger.error("Neither pyglet nor trimesh viewer available")
-            return False
+        The view matrix is left pushed on the modelview stack so each frame
+        can restore it with a pop/push instead of rebuilding it.
+        """
+        fb_width, fb_height = self._window.get_framebuffer_size()
+        glViewport(0, 0, fb_width, fb_height)
+
+        glMatrixMode(GL_PROJECTION)
+        glLoadIdentity()
+        gluPerspective(45, (self._window.width / self._window.height), 0.1, 100.0)
+
+        glMatrixMode(GL_MODELVIEW)
+        if self._view_pushed:
+            glPopMatrix()
+        glLoadIdentity()
+        gluLookAt(0, 0, 6,  # Eye - moved further back for better view
+                  0, 0, 0,   # Target
+                  0, 1, 0)    # Up
+        glPushMatrix()
+        self._view_pushed = True
+        return pyglet.event.EVENT_HANDLED
+
+    def _set_window_visible(self, visible: bool) -> None:
+        """Track whether the window is shown (pyglet on_show/on_hide)."""
+        self._window_visible = visible
 
     def _use_viewer_mode(self) -> bool:
         """Use trimesh's built-in viewer."""
@@ -357,39 +795,27 @@ class Real3DDisplayBackend(DisplayBackend):
             logger.error("Display not initialized")
             return False
 
-        if not content.file_path.exists():
+        # Shares the per-second stat cache with the Looking Glass backend
+        mtime_ns = _path_mtime_ns(content._file_path_str, int(time.monotonic()))
+        if mtime_ns is None:
             logger.error(f"Content file not found: {content.file_path}")
             return False
 
         try:
-            import trimesh
-
-            # Load the 3D model
-            logger.info(f"Loading 3D model: {content.file_path}")
-            scene = trimesh.load(str(content.file_path), force_load_meshes=True)
-
-            # Log scene info for debugging
-            logger.info(f"  Scene geometries: {len(scene.geometry)}")
-            for name, geom in scene.geometry.items():
-                logger.info(f"    - {name}: {len(geom.vertices)} vertices, {len(geom.faces)} faces")
-                if hasattr(geom, 'visual') and geom.visual:
-                    logger.info(f"      Visual: {type(geom.visual).__name__}")
-                    if hasattr(geom.visual, 'material') and geom.visual.material:
-                        mat = geom.visual.material
-                        logger.info(f"      Material: {type(mat).__name__}")
-                        if hasattr(mat, 'diffuse'):
-                            logger.info(f"      diffuse: {mat.diffuse}")
-                        if hasattr(mat, 'colors'):
-                            logger.info(f"      colors: {mat.colors}")
-                    if hasattr(geom.visual, 'face_colors'):
-                        fc = geom.visual.face_colors
-                        logger.info(f"      face_colors: shape={fc.shape if hasattr(fc, 'shape') else 'N/A'}")
-                    if hasattr(geom.visual, 'main_color'):
-                        mc = geom.visual.main_color
-                        logger.info(f"      main_color: {mc}")
-
-            # Center and scale the model
-            scene = self._normalize_scene(scene)
+            key = (content._file_path_str, mtime_ns)
+            cached = self._scene_cache.get(key)
+            if cached is not None:
+                # Shown before and unchanged on disk; reuse the compiled draw
+                self._scene_cache.move_to_end(key)
+                self._display_list, scene = cached
+            else:
+                scene, vertices, indices = self._take_prefetched(key)
+
+                # Build the scene draw once; frames only replay it
+                self._display_list = None
+                if self._window is not None:
+                    self._display_list = self._compile_scene(vertices, indices)
+                    self._cache_scene(key, self._display_list, scene)
 
             self._scene = scene
             self.current_content = content
@@ -402,32 +828,116 @@ class Real3DDisplayBackend(DisplayBackend):
             logger.error(f"Failed to display 3D content: {e}")
             return False
 
-    def _normalize_scene(self, scene):
-        """Center and scale scene for display."""
-        import numpy as np
-        import trimesh
+    def preload(self, content: ContentItem) -> None:
+        """
+        Parse and pack a model in the background ahead of show_content().
 
-        # Get scene bounds - returns numpy array with shape (2, 3)
-        # bounds[0] is min, bounds[1] is max
-        bounds = scene.bounds
-        if bounds is not None and bounds.shape == (2, 3):
-            # Calculate centroid (center of bounds)
-            centroid = (bounds[0] + bounds[1]) / 2
+        Only the CPU side (GLB parse, normalization, vertex packing) runs
+        ahead; the GL upload still happens on the rendering thread.
+        """
+        mtime_ns = _path_mtime_ns(content._file_path_str, int(time.monotonic()))
+        if mtime_ns is None:
+            return
 
-            # Center the scene - apply_translation takes a translation vector
-            translation = -centroid
-            for geom in scene.geometry.values():
-                geom.apply_translation(translation)
+        # Keyed like _scene_cache, so a file replaced after preload is reloaded
+        key = (content._file_path_str, mtime_ns)
+        if key in self._scene_cache:
+            return
+
+        with self._prefetch_lock:
+            if key in self._prefetched:
+                return
+            if self._prefetch_pool is None:
+                self._prefetch_pool = ThreadPoolExecutor(
+                    max_workers=2,
+                    thread_name_prefix="real3d-prefetch",
+                )
+            self._prefetched[key] = self._prefetch_pool.submit(self._load_scene, content._file_path_str)
+            while len(self._prefetched) > PRELOAD_DEPTH:
+                _, stale = self._prefetched.popitem(last=False)
+                stale.cancel()
+
+    def _take_prefetched(self, key: Tuple[str, int]):
+        """
+        Return (scene, vertices, indices), from the prefetch if one is pending.
+
+        Args:
+            key: (path, mtime_ns) of the file being shown
+        """
+        path_str = key[0]
+        with self._prefetch_lock:
+            future = self._prefetched.pop(key, None)
+            # Prefetches of other versions of this file are stale
+            for stale_key in [k for k in self._prefetched if k[0] == path_str]:
+                self._prefetched.pop(stale_key).cancel()
+        if future is not None and not future.cancelled():
+            return future.result()
+        return self._load_scene(path_str)
+
+    def _load_scene(self, path_str: str):
+        """
+        Load a GLB and prepare its vertex data for upload.
+
+        Args:
+            path_str: Model file path
+
+        Returns:
+            Tuple of (normalized scene, vertex array, index array)
+        """
+        # Load the 3D model
+        logger.info(f"Loading 3D model: {path_str}")
+        scene = trimesh.load(path_str, force_load_meshes=True)
+
+        # Log scene info for debugging
+        logger.info(f"  Scene geometries: {len(scene.geometry)}")
+        for name, geom in scene.geometry.items():
+            logger.info(f"    - {name}: {len(geom.vertices)} vertices, {len(geom.faces)} faces")
+            if hasattr(geom, 'visual') and geom.visual:
+                logger.info(f"      Visual: {type(geom.visual).__name__}")
+                if hasattr(geom.visual, 'material') and geom.visual.material:
+                    mat = geom.visual.material
+                    logger.info(f"      Material: {type(mat).__name__}")
+                    if hasattr(mat, 'diffuse'):
+                        logger.info(f"      diffuse: {mat.diffuse}")
+                    if hasattr(mat, 'colors'):
+                        logger.info(f"      colors: {mat.colors}")
+                if hasattr(geom.visual, 'face_colors'):
+                    fc = geom.visual.face_colors
+                    logger.info(f"      face_colors: shape={fc.shape if hasattr(fc, 'shape') else 'N/A'}")
+                if hasattr(geom.visual, 'main_color'):
+                    mc = geom.visual.main_color
+                    logger.info(f"      main_color: {mc}")
+
+        # Flatten the scene graph into one transformed copy per mesh
+        # instance, then center and scale the copies
+        meshes = list(scene.dump())
+        self._normalize_meshes(meshes)
+
+        vertices, indices = self._scene_arrays(meshes)
+        return scene, vertices, indices
+
+    def _normalize_meshes(self, meshes: List[Any]) -> None:
+        """Center and scale flattened scene meshes for display, in place."""
+        lo = np.full(3, np.inf)
+        hi = np.full(3, -np.inf)
+        for geom in meshes:
+            _accumulate_bounds(np.asarray(geom.vertices), lo, hi)
+
+        if np.all(lo <= hi):
+            # Calculate centroid (center of bounds)
+            centroid = (lo + hi) / 2
 
             # Scale to fit in view
-            extents = bounds[1] - bounds[0]  # Size along each axis
+            extents = hi - lo  # Size along each axis
             max_extent = float(np.max(extents))
-            if max_extent > 0:
-                scale = 1.5 / max_extent  # Make it fill about 75% of view
-                for geom in scene.geometry.values():
-                    geom.apply_scale([scale, scale, scale])
+            scale = 1.5 / max_extent if max_extent > 0 else 1.0  # Fill about 75% of view
 
-        return scene
+            # Center and scale each mesh in place while its vertices are in
+            # cache; trimesh's tracked arrays invalidate derived caches on write
+            for geom in meshes:
+                vertices = geom.vertices
+                np.subtract(vertices, centroid, out=vertices)
+                np.multiply(vertices, scale, out=vertices)
 
     def _start_rendering(self, duration: Optional[int] = None):
         """
@@ -445,11 +955,10 @@ class Real3DDisplayBackend(DisplayBackend):
             pyglet.app.run()
         else:
             # Run for specified duration using clock tick
-            import time as time_module
-            start_time = time_module.time()
+            start_time = time.time()
 
             def update(dt):
-                elapsed = time_module.time() - start_time
+                elapsed = time.time() - start_time
                 if elapsed >= duration:
                     pyglet.app.exit()
 
@@ -457,9 +966,199 @@ class Real3DDisplayBackend(DisplayBackend):
             pyglet.clock.schedule_interval(update, 0.1)
             pyglet.app.run()
 
+    def _mesh_colors(self, geom, mesh_idx: int):
+        """
+        Get per-face RGB colors for a mesh.
+
+        Uses the material diffuse color, then face colors, then the main
+        color, and finally a distinct default hue per mesh.
+
+        Args:
+            geom: trimesh geometry
+            mesh_idx: Index of the geometry within the scene
+
+        Returns:
+            uint8 array of shape (len(faces), 3)
+        """
+        face_count = len(geom.faces)
+        colors = None
+
+        visual = getattr(geom, 'visual', None)
+        if visual:
+            # Try to get diffuse color from material
+            mat = getattr(visual, 'material', None)
+            diffuse = getattr(mat, 'diffuse', None) if mat else None
+            if isinstance(diffuse, (list, tuple, np.ndarray)) and len(diffuse) >= 3:
+                logger.debug(f"Using diffuse color: {diffuse[:3]}")
+                colors = np.tile(np.asarray(diffuse[:3]), (face_count, 1))
+            elif getattr(visual, 'face_colors', None) is not None:
+                colors = np.asarray(visual.face_colors)[:, :3]
+            elif getattr(visual, 'main_color', None) is not None:
+                colors = np.tile(np.asarray(visual.main_color[:3]), (face_count, 1))
+
+        if colors is None or len(colors) != face_count:
+            # Use different colors for different meshes for visual distinction
+            hue = (mesh_idx * 0.2) % 1.0
+            colors = np.tile(colorsys.hsv_to_rgb(hue, 0.6, 0.7), (face_count, 1))
+
+        # trimesh stores material/face colors as 0-255 bytes already
+        if colors.dtype == np.uint8:
+            return colors
+        return (np.clip(colors, 0.0, 1.0) * 255.0 + 0.5).astype(np.uint8)
+
+    def _mesh_arrays(self, geom, mesh_idx: int):
+        """
+        Build the vertex and index arrays for a mesh.
+
+        Args:
+            geom: trimesh geometry
+            mesh_idx: Index of the geometry within the scene
+
+        Returns:
+            Tuple of (interleaved vertices, uint32 faces)
+        """
+        # Always a copy, so indices can be rebased in place without touching the mesh
+        faces = np.array(geom.faces, dtype=np.uint32)
+        face_colors = self._mesh_colors(geom, mesh_idx)
+
+        # trimesh keeps float64 vertices; the GPU only needs float32, and
+        # colors fit in normalized bytes, so each vertex packs into 16 bytes
+        vertex_data = np.empty(len(geom.vertices), dtype=_vertex_dtype())
+        vertex_data["position"] = geom.vertices
+        colors = vertex_data["color"]
+        colors[:] = (204, 204, 204, 255)
+        # A vertex shared by differently colored faces takes the last color
+        for corner in range(3):
+            colors[faces[:, corner], :3] = face_colors
+        return vertex_data, faces
+
+    def _scene_arrays(self, meshes: List[Any]):
+        """
+        Pack all scene meshes into one vertex and one index array.
+
+        Indices of each mesh are rebased onto its offset in the shared
+        vertex array, so the whole scene draws with a single call.
+
+        Args:
+            meshes: Normalized meshes from the flattened scene
+
+        Returns:
+            Tuple of (vertex array, uint16 or uint32 index array)
+        """
+        vertex_parts = []
+        index_parts = []
+        base_vertex = 0
+        for mesh_idx, geom in enumerate(meshes):
+            # Point clouds and empty meshes would upload vertices never drawn
+            if len(getattr(geom, "faces", ())) == 0:
+                continue
+            vertex_data, faces = self._mesh_arrays(geom, mesh_idx)
+            if base_vertex:
+                faces += np.uint32(base_vertex)
+            vertex_parts.append(vertex_data)
+            index_parts.append(faces)
+            base_vertex += len(vertex_data)
+
+        if len(vertex_parts) == 1:
+            # Common single-mesh GLB: upload the arrays as built, no copies
+            vertices, indices = vertex_parts[0], index_parts[0]
+        elif vertex_parts:
+            vertices = np.concatenate(vertex_parts)
+            indices = np.concatenate(index_parts)
+        else:
+            vertices = np.empty(0, dtype=_vertex_dtype())
+            indices = np.empty((0, 3), dtype=np.uint32)
+
+        # Most scenes fit in 16-bit indices, halving the index buffer
+        if len(vertices) <= 0xFFFF:
+            indices = indices.astype(np.uint16)
+        return vertices, indices
+
+    def _upload_scene(self, vertices, indices) -> Tuple[int, int, int, int]:
+        """
+        Upload packed scene arrays into static vertex and index buffers.
+
+        Args:
+            vertices: Vertex array from _scene_arrays()
+            indices: Index array from _scene_arrays()
+
+        Returns:
+            Tuple of (vertex buffer, index buffer, index count, index type)
+        """
+        index_type = GL_UNSIGNED_SHORT if indices.dtype == np.uint16 else GL_UNSIGNED_INT
+
+        vbo = int(glGenBuffers(1))
+        glBindBuffer(GL_ARRAY_BUFFER, vbo)
+        # Both arrays are freshly built and C-contiguous, so hand GL their
+        # raw pointers rather than going through PyOpenGL's array converters
+        glBufferData(GL_ARRAY_BUFFER, vertices.nbytes, vertices.ctypes.data_as(ctypes.c_void_p), GL_STATIC_DRAW)
+
+        ibo = int(glGenBuffers(1))
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, ibo)
+        glBufferData(GL_ELEMENT_ARRAY_BUFFER, indices.nbytes, indices.ctypes.data_as(ctypes.c_void_p), GL_STATIC_DRAW)
+
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+        return vbo, ibo, indices.size, index_type
+
+    def _compile_scene(self, vertices, indices) -> int:
+        """
+        Compile the scene draw into a display list.
+
+        Vertex array data is copied into the list when it is compiled, so
+        the staging buffers are released straight away and each frame only
+        replays the list.
+
+        Args:
+            vertices: Vertex array from _scene_arrays()
+            indices: Index array from _scene_arrays()
+
+        Returns:
+            Display list name
+        """
+        vbo, ibo, index_count, index_type = self._upload_scene(vertices, indices)
+
+        # Client array state is not recorded in lists; set it up around them
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_COLOR_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, vbo)
+        glVertexPointer(3, GL_FLOAT, _VERTEX_STRIDE, None)
+        glColorPointer(4, GL_UNSIGNED_BYTE, _VERTEX_STRIDE, ctypes.c_void_p(_VERTEX_COLOR_OFFSET))
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, ibo)
+
+        display_list = int(glGenLists(1))
+        glNewList(display_list, GL_COMPILE)
+        glRotatef(30, 1, 0, 0)  # Tilt down a bit
+        glEnable(GL_DEPTH_TEST)
+        glDrawElements(GL_TRIANGLES, index_count, index_type, None)
+        glEndList()
+
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+        glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glDeleteBuffers(2, [vbo, ibo])
+        return display_list
+
+    def _cache_scene(self, key: Tuple[str, Optional[int]], display_list: int, scene: Any) -> None:
+        """Remember a compiled scene, deleting the least recently shown beyond SCENE_CACHE_SIZE."""
+        self._scene_cache[key] = (display_list, scene)
+        while len(self._scene_cache) > SCENE_CACHE_SIZE:
+            _, (stale_list, _) = self._scene_cache.popitem(last=False)
+            glDeleteLists(stale_list, 1)
+
+    def _free_display_lists(self) -> None:
+        """Delete all compiled scenes."""
+        if PYGLET_AVAILABLE:
+            for display_list, _ in self._scene_cache.values():
+                glDeleteLists(display_list, 1)
+        self._scene_cache.clear()
+        self._display_list = None
+
     def _render_scene(self):
         """Render the current scene (called by pyglet)."""
-        import numpy as np
+        if not self._window_visible:
+            return
 
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
 
@@ -467,105 +1166,83 @@ class Real3DDisplayBackend(DisplayBackend):
             # Log occasionally to confirm rendering is happening
             if int(self._rotation) % 10 == 0:
                 logger.info(f"Rendering: rotation={self._rotation:.1f}, geometries={len(self._scene.geometry)}")
-            # Set up simple camera
-            glMatrixMode(GL_PROJECTION)
-            glLoadIdentity()
-            gluPerspective(45, (self._window.width / self._window.height), 0.1, 100.0)
-
-            glMatrixMode(GL_MODELVIEW)
-            glLoadIdentity()
-            gluLookAt(0, 0, 6,  # Eye - moved further back for better view
-                      0, 0, 0,   # Target
-                      0, 1, 0)    # Up
-
-            # Apply rotation
-            glRotatef(self._rotation, 0, 1, 0)
-            glRotatef(30, 1, 0, 0)  # Tilt down a bit
-
-            # Get geometry from scene and render each mesh
-            for mesh_idx, geom in enumerate(self._scene.geometry.values()):
-                vertices = geom.vertices
-                faces = geom.faces
-
-                # Get colors from visual or use default colors
-                use_default_color = False
-                mesh_color = None
-
-                if hasattr(geom, 'visual') and geom.visual:
-                    # Try to get diffuse color from material
-                    if hasattr(geom.visual, 'material') and geom.visual.material:
-                        mat = geom.visual.material
-                        # Check for diffuse color in material
-                        if hasattr(mat, 'diffuse') and mat.diffuse is not None:
-                            diffuse = mat.diffuse
-                            if isinstance(diffuse, (list, tuple, np.ndarray)) and len(diffuse) >= 3:
-                                mesh_color = np.array(diffuse[:3])
-                                logger.debug(f"Using diffuse color: {mesh_color}")
-
-                    # Fall back to face_colors if available
-                    if mesh_color is None and hasattr(geom.visual, 'face_colors') and geom.visual.face_colors is not None:
-                        colors = geom.visual.face_colors
-                    elif mesh_color is not None:
-                        # Use mesh color for all faces
-                        colors = np.tile(mesh_color, (len(faces), 1))
-                    elif hasattr(geom.visual, 'main_color') and geom.visual.main_color is not None:
-                        # Use main color for all faces
-                        main_color = geom.visual.main_color
-                        colors = np.tile(main_color[:3], (len(faces), 1))
-                    else:
-                        use_default_color = True
-                else:
-                    use_default_color = True
-
-                if use_default_color:
-                    # Use different colors for different meshes for visual distinction
-                    hue = (mesh_idx * 0.2) % 1.0  # Different hue for each mesh
-                    import colorsys
-                    rgb = colorsys.hsv_to_rgb(hue, 0.6, 0.7)  # HSV to RGB
-                    colors = np.ones((len(faces), 3), dtype=np.float32) * list(rgb)
-
-                # Enable depth testing
-                glEnable(GL_DEPTH_TEST)
-
-                # Draw each face
-                for i, face in enumerate(faces):
-                    # Get triangle vertices
-                    v0 = vertices[face[0]]
-                    v1 = vertices[face[1]]
-                    v2 = vertices[face[2]]
-
-                    # Get face color
-                    if i < len(colors):
-                        c = colors[i]
-                        if len(c) >= 3:
-                            glColor3f(c[0], c[1], c[2])
-                        else:
-                            glColor3f(0.8, 0.8, 0.8)
-                    else:
-                        glColor3f(0.8, 0.8, 0.8)
-
-                    # Draw triangle
-                    glBegin(GL_TRIANGLES)
-                    glNormal3f(0, 0, 1)  # Simple normal
-                    glVertex3f(v0[0], v0[1], v0[2])
-                    glVertex3f(v1[0], v1[1], v1[2])
-                    glVertex3f(v2[0], v2[1], v2[2])
-                    glEnd()
+            # Restore the camera view saved by _setup_camera, then rotate
+            glPopMatrix()
+            glPushMatrix()
+            # Spin about Y; the fixed tilt is part of the display list
+            angle = math.radians(self._rotation)
+            cos_a, sin_a = math.cos(angle), math.sin(angle)
+            m = self._rotation_matrix
+            m[0], m[2], m[8], m[10] = cos_a, -sin_a, sin_a, cos_a
+            glMultMatrixf(m)
+
+            if self._display_list is not None:
+                glCallList(self._display_list)
 
             self._rotation += 0.5
 
         glFlush()
 
+    def capture_frame(self) -> Optional[bytes]:
+        """
+        Read back rendered frames without stalling on the GPU.
+
+        Each call starts an asynchronous read of the current back buffer
+        into one of two pixel buffer objects and returns the frame started
+        by the previous call. Call after rendering and before the flip.
+
+        Returns:
+            RGBA bytes of the previous frame (bottom row first), or None on
+            the first call or when no window is available
+        """
+        if self._window is None or not PYGLET_AVAILABLE:
+            return None
+
+        width, height = self._window.get_framebuffer_size()
+        size = width * height * 4
+        if size != self._pbo_size:
+            self._free_pbos()
+            self._pbos = [int(glGenBuffers(1)) for _ in range(2)]
+            for pbo in self._pbos:
+                glBindBuffer(GL_PIXEL_PACK_BUFFER, pbo)
+                glBufferData(GL_PIXEL_PACK_BUFFER, size, None, GL_STREAM_READ)
+            self._pbo_size = size
+
+        glBindBuffer(GL_PIXEL_PACK_BUFFER, self._pbos[self._capture_count % 2])
+        glReadPixels(0, 0, width, height, GL_RGBA, GL_UNSIGNED_BYTE, ctypes.c_void_p(0))
+
+        frame = None
+        if self._capture_count > 0:
+            glBindBuffer(GL_PIXEL_PACK_BUFFER, self._pbos[(self._capture_count + 1) % 2])
+            ptr = glMapBuffer(GL_PIXEL_PACK_BUFFER, GL_READ_ONLY)
+            if ptr:
+                frame = ctypes.string_at(ptr, size)
+                glUnmapBuffer(GL_PIXEL_PACK_BUFFER)
+        glBindBuffer(GL_PIXEL_PACK_BUFFER, 0)
+
+        self._capture_count += 1
+        return frame
+
+    def _free_pbos(self) -> None:
+        """Delete the frame capture pixel buffers."""
+        if self._pbos and PYGLET_AVAILABLE:
+            glDeleteBuffers(len(self._pbos), self._pbos)
+        self._pbos = []
+        self._pbo_size = 0
+        self._capture_count = 0
+
     def clear(self) -> None:
         """Clear display."""
         self._scene = None
         self.current_content = None
+        # Compiled scenes stay cached for the next show
+        self._display_list = None
         if self._window is not None and PYGLET_AVAILABLE:
             glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
 
     def set_brightness(self, brightness: int) -> None:
         """Set display brightness (0-100)."""
-        self.config.brightness = max(0, min(100, brightness))
+        self.config.brightness = 0 if brightness < 0 else 100 if brightness > 100 else brightness
         # Clear color brightness adjustment
         if self._initialized and self._window is not None:
             b = brightness / 100.0
@@ -573,6 +1250,13 @@ class Real3DDisplayBackend(DisplayBackend):
 
     def shutdown(self) -> None:
         """Shutdown display."""
+        self._free_display_lists()
+        self._free_pbos()
+        with self._prefetch_lock:
+            self._prefetched.clear()
+        if self._prefetch_pool is not None:
+            self._prefetch_pool.shutdown(wait=False, cancel_futures=True)
+            self._prefetch_pool = None
         if self._window is not None:
             if PYGLET_AVAILABLE:
                 pyglet.app.exit()
@@ -581,6 +1265,26 @@ class Real3DDisplayBackend(DisplayBackend):
         self.current_content = None
 
 
+# Hardware backends by display type; simulation and real-3D modes bypass this
+_BACKENDS: Dict[DisplayType, type] = {
+    DisplayType.LOOKING_GLASS_PORTRAIT: LookingGlassDisplayBackend,
+    DisplayType.LOOKING_GLASS_16: LookingGlassDisplayBackend,
+    DisplayType.LOOKING_GLASS_32: LookingGlassDisplayBackend,
+    DisplayType.LOOKING_GLASS_65: LookingGlassDisplayBackend,
+}
+
+
+def register_backend(display_type: DisplayType, backend_cls: type) -> None:
+    """
+    Register a hardware backend for a display type.
+
+    Args:
+        display_type: Display type the backend drives
+        backend_cls: Backend class, constructed with a DisplayConfig
+    """
+    _BACKENDS[display_type] = backend_cls
+
+
 class DisplayManager:
     """
     Main display manager for holographic content.
@@ -593,18 +1297,24 @@ class DisplayManager:
         self.simulation_mode = simulation_mode
         self.real_3d = real_3d
         self.backend: Optional[DisplayBackend] = None
+        self._preload_executor: Optional[ThreadPoolExecutor] = None
 
     def initialize(self) -> bool:
         """Initialize display backend."""
         if self.real_3d:
             # Try real 3D display (pyglet + trimesh)
-            self.backend = Real3DDisplayBackend(self.config)
+            backend_cls = Real3DDisplayBackend
         elif self.simulation_mode:
-            self.backend = SimulationDisplayBackend(self.config)
+            backend_cls = SimulationDisplayBackend
         else:
-            # Try Looking Glass SDK
-            self.backend = LookingGlassDisplayBackend(self.config)
+            backend_cls = _BACKENDS.get(self.config.display_type)
+            if backend_cls is None:
+                logger.warning(
+                    f"No hardware backend for {self.config.display_type.value}, using simulation"
+                )
+                backend_cls = SimulationDisplayBackend
 
+        self.backend = backend_cls(self.config)
         return self.backend.initialize()
 
     def show_asset(self, asset_id: str, file_path: Path, content_type: str, metadata: Optional[Dict] = None) -> bool:
@@ -629,13 +1339,20 @@ class DisplayManager:
         )
         return self.backend.show_content(content)
 
-    def show_playlist_item(self, item: Dict[str, Any], content_manager) -> bool:
+    def show_playlist_item(
+        self,
+        item: Dict[str, Any],
+        content_manager,
+        next_item: Optional[Dict[str, Any]] = None,
+    ) -> bool:
         """
         Show item from playlist.
 
         Args:
             item: Playlist item dictionary
             content_manager: ContentManager instance
+            next_item: Optional upcoming playlist item to preload while this
+                one is on screen
 
         Returns:
             True if successful
@@ -651,13 +1368,149 @@ class DisplayManager:
             logger.error(f"Asset {asset_id} not cached")
             return False
 
-        return self.show_asset(
+        success = self.backend.show_content(self._build_content(item, asset_id, content_path))
+
+        if next_item is not None:
+            self.preload_playlist_item(next_item, content_manager)
+
+        return success
+
+    def prepare_playlist(
+        self,
+        items: List[Dict[str, Any]],
+        content_manager,
+    ) -> List[Optional[ContentItem]]:
+        """
+        Convert playlist items into ready-to-show ContentItems.
+
+        Does all dictionary lookups and cache path resolution once, so the
+        display loop can pass the results straight to show_content().
+
+        Args:
+            items: Playlist item dictionaries
+            content_manager: ContentManager instance
+
+        Returns:
+            ContentItem per playlist item, None where the item is invalid or
+            its asset is not cached
+        """
+        asset_ids = [item.get("asset_id") for item in items]
+        paths = iter(content_manager.get_content_for_display_batch(
+            [asset_id for asset_id in asset_ids if asset_id]
+        ))
+
+        contents: List[Optional[ContentItem]] = []
+        for item, asset_id in zip(items, asset_ids):
+            if not asset_id:
+                logger.error("Playlist item missing asset_id")
+                contents.append(None)
+                continue
+            content_path = next(paths)
+            if not content_path:
+                logger.error(f"Asset {asset_id} not cached")
+                contents.append(None)
+                continue
+            contents.append(self._build_content(item, asset_id, content_path))
+        return contents
+
+    def show_playlist(self, items: List[Dict[str, Any]], content_manager) -> List[bool]:
+        """
+        Show a whole playlist in order.
+
+        Content paths are resolved with one batch lookup and the items are
+        handed to the backend as a single sequence.
+
+        Args:
+            items: Playlist item dictionaries
+            content_manager: ContentManager instance
+
+        Returns:
+            Success flag per item
+        """
+        prepared = self.prepare_playlist(items, content_manager)
+        positions = [i for i, content in enumerate(prepared) if content is not None]
+
+        results = [False] * len(items)
+        contents = [prepared[i] for i in positions]
+        show_contents = getattr(self.backend, "show_contents", None)
+        if show_contents is not None:
+            shown = show_contents(contents)
+        else:
+            shown = _show_sequence(self.backend, contents)
+        for i, success in zip(positions, shown):
+            results[i] = success
+        return results
+
+    def _build_content(self, item: Dict[str, Any], asset_id: str, content_path: Path) -> ContentItem:
+        """Build a ContentItem from a playlist item dictionary."""
+        metadata = item.get("metadata") or {}
+        return ContentItem(
             asset_id=asset_id,
             file_path=content_path,
-            content_type=item.get("content_type", "model/glb"),
-            metadata=item.get("metadata", {}),
+            content_type=item.get("content_type") or item.get("asset_mime_type") or "model/glb",
+            duration=metadata.get("duration") or item.get("duration_seconds"),
+            metadata=metadata,
         )
 
+    def show_content(self, content: ContentItem) -> bool:
+        """
+        Show a prepared content item.
+
+        Args:
+            content: ContentItem, e.g. from prepare_playlist()
+
+        Returns:
+            True if successful
+        """
+        return self.backend.show_content(content)
+
+    def preload(self, content: ContentItem) -> None:
+        """
+        Preload a prepared content item in the background.
+
+        Args:
+            content: ContentItem, e.g. from prepare_playlist()
+        """
+        if self._preload_executor is None:
+            self._preload_executor = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix="display-preload",
+            )
+        self._preload_executor.submit(self._preload, content)
+
+    def preload_playlist_item(self, item: Dict[str, Any], content_manager) -> None:
+        """
+        Preload a playlist item in the background ahead of display.
+
+        Args:
+            item: Playlist item dictionary
+            content_manager: ContentManager instance
+        """
+        asset_id = item.get("asset_id")
+        if not asset_id:
+            return
+
+        content_path = content_manager.get_content_for_display(asset_id)
+        if not content_path:
+            return
+
+        self.preload(self._build_content(item, asset_id, content_path))
+
+    def _preload(self, content: ContentItem) -> None:
+        """Run backend preload, logging failures instead of raising."""
+        preload = getattr(self.backend, "preload", None)
+        if preload is None:
+            return
+        try:
+            preload(content)
+        except Exception as e:
+            logger.warning(f"Failed to preload {content.asset_id}: {e}")
+
+    def is_busy(self) -> bool:
+        """Return True while the backend is still displaying timed content."""
+        is_busy = getattr(self.backend, "is_busy", None)
+        return is_busy is not None and is_busy()
+
     def clear(self) -> None:
         """Clear display."""
         self.backend.clear()
@@ -668,4 +1521,7 @@ class DisplayManager:
 
     def shutdown(self) -> None:
         """Shutdown display."""
+        if self._preload_executor is not None:
+            self._preload_executor.shutdown(wait=True, cancel_futures=True)
+            self._preload_executor = None
         self.backend.shutdown()
@@ -5,13 +5,39 @@ Load and prepare 3D models for holographic display.
 Supports GLB/GLTF files commonly used for holographic content.
 """
 import logging
+import threading
+from collections import OrderedDict
+from multiprocessing.shared_memory import SharedMemory
 from pathlib import Path
-from typing import Optional, Tuple, Any
+from typing import Optional, Tuple, Any, Dict, List
 import numpy as np
 
 
 logger = logging.getLogger(__name__)
 
+# Parsed scenes kept for repeat loads of unchanged files
+MODEL_CACHE_SIZE = 16
+
+
+def attach_shared_mesh(descriptor: Dict[str, Any]) -> Tuple[Dict[str, np.ndarray], List[SharedMemory]]:
+    """
+    Map mesh arrays exported by ModelLoader.export_shared() in another process.
+
+    Args:
+        descriptor: Descriptor returned by export_shared()
+
+    Returns:
+        Tuple of (arrays by name, shared memory handles). The arrays are
+        views into the shared pages; close the handles once done with them.
+    """
+    arrays = {}
+    handles = []
+    for key, spec in descriptor.items():
+        shm = SharedMemory(name=spec["name"])
+        handles.append(shm)
+        arrays[key] = np.ndarray(tuple(spec["shape"]), dtype=np.dtype(spec["dtype"]), buffer=shm.buf)
+    return arrays, handles
+
 
 class ModelLoader:
     """
@@ -26,6 +52,11 @@ class ModelLoader:
     def __init__(self):
         self._trimesh = None
         self._pyrender = None
+        # (path, mtime_ns) -> parsed scene, least recently used first
+        self._scene_cache: "OrderedDict[Tuple[str, int], Any]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # Shared memory blocks created by export_shared(), by name
+        self._shared: Dict[str, SharedMemory] = {}
 
         # Try to import trimesh for GLB loading
         try:
@@ -47,6 +78,10 @@ class ModelLoader:
         """
         Load a GLB/GLTF 3D model.
 
+        Parsed scenes are cached by path and modification time, so repeat
+        loads of an unchanged file skip parsing. Each call returns its own
+        copy, since callers such as normalize_model() modify it in place.
+
         Args:
             file_path: Path to GLB file
 
@@ -57,17 +92,32 @@ class ModelLoader:
             logger.error("trimesh not available, cannot load 3D models")
             return None
 
-        if not file_path.exists():
+        try:
+            key = (str(file_path), file_path.stat().st_mtime_ns)
+        except OSError:
             logger.error(f"Model file not found: {file_path}")
             return None
 
+        with self._cache_lock:
+            scene = self._scene_cache.get(key)
+            if scene is not None:
+                self._scene_cache.move_to_end(key)
+        if scene is not None:
+            logger.debug(f"Using cached model for {file_path}")
+            return scene.copy()
+
         try:
             # Load GLB file
-            scene = self._trimesh.load(str(file_path), force_load_meshes=True)
+            scene = self._trimesh.load(key[0], force_load_meshes=True)
             logger.info(f"Loaded model from {file_path}")
             logger.debug(f"  Geometry: {len(scene.geometry)} geometries")
             logger.debug(f"  Graph: {len(scene.graph.nodes)} nodes")
-            return scene
+
+            with self._cache_lock:
+                self._scene_cache[key] = scene
+                while len(self._scene_cache) > MODEL_CACHE_SIZE:
+                    self._scene_cache.popitem(last=False)
+            return scene.copy()
         except Exception as e:
             logger.error(f"Failed to load model from {file_path}: {e}")
             return None
@@ -86,19 +136,18 @@ class ModelLoader:
             return {}
 
         try:
-            # Extract mesh information
-            mesh_count = len(model.geometry)
-            vertex_count = 0
-            face_count = 0
-
-            for geom in model.geometry.values():
-                v = geom.vertices
-                f = geom.faces
-                vertex_count += len(v)
-                if hasattr(f, 'shape'):
-                    face_count += f.shape[0] if len(f.shape) == 1 else np.prod(f.shape[:-1])
-                else:
-                    face_count += len(f)
+            # Extract mesh information; trimesh always stores vertices as
+            # (n, 3) and faces as (m, 3) arrays
+            geoms = list(model.geometry.values())
+            mesh_count = len(geoms)
+            vertex_sizes = np.fromiter(
+                (geom.vertices.shape[0] for geom in geoms), dtype=np.int64, count=mesh_count
+            )
+            face_sizes = np.fromiter(
+                (geom.faces.shape[0] for geom in geoms), dtype=np.int64, count=mesh_count
+            )
+            vertex_count = int(vertex_sizes.sum())
+            face_count = int(face_sizes.sum())
 
             # Extract metadata
             metadata = {}
@@ -151,12 +200,76 @@ class ModelLoader:
             logger.error(f"Failed to normalize model: {e}")
             return model
 
-    def get_model_display_data(self, file_path: Path) -> Optional[Tuple[Any, dict]]:
+    def export_shared(self, model: Any) -> Optional[Dict[str, Any]]:
+        """
+        Copy a model's flattened mesh data into shared memory.
+
+        Vertices (float32) and faces (uint32, rebased across meshes) are
+        written once; other processes map them with attach_shared_mesh()
+        instead of loading the model again.
+
+        Args:
+            model: trimesh.Scene object
+
+        Returns:
+            Picklable descriptor of the shared arrays, or None on failure
+        """
+        if model is None:
+            return None
+
+        try:
+            meshes = [geom for geom in model.dump() if len(getattr(geom, "faces", ()))]
+            vertex_parts = []
+            face_parts = []
+            base_vertex = 0
+            for geom in meshes:
+                vertex_parts.append(np.asarray(geom.vertices, dtype=np.float32))
+                face_parts.append(np.asarray(geom.faces, dtype=np.uint32) + np.uint32(base_vertex))
+                base_vertex += len(geom.vertices)
+
+            arrays = {
+                "vertices": np.concatenate(vertex_parts) if vertex_parts else np.empty((0, 3), np.float32),
+                "faces": np.concatenate(face_parts) if face_parts else np.empty((0, 3), np.uint32),
+            }
+
+            descriptor = {}
+            for key, array in arrays.items():
+                # Zero-size blocks are not allowed
+                shm = SharedMemory(create=True, size=max(array.nbytes, 1))
+                np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[:] = array
+                self._shared[shm.name] = shm
+                descriptor[key] = {
+                    "name": shm.name,
+                    "shape": array.shape,
+                    "dtype": array.dtype.str,
+                }
+            return descriptor
+        except Exception as e:
+            logger.error(f"Failed to export model to shared memory: {e}")
+            return None
+
+    def release_shared(self, descriptor: Dict[str, Any]) -> None:
+        """
+        Free shared memory created by export_shared().
+
+        Args:
+            descriptor: Descriptor returned by export_shared()
+        """
+        for spec in descriptor.values():
+            shm = self._shared.pop(spec["name"], None)
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+
+    def get_model_display_data(self, file_path: Path, share: bool = False) -> Optional[Tuple[Any, dict]]:
         """
         Load and prepare model for display.
 
         Args:
             file_path: Path to GLB file
+            share: Also export the mesh data to shared memory; the descriptor
+                is returned as info["shared"] and must be released with
+                release_shared()
 
         Returns:
             Tuple of (model, info) or None
@@ -169,6 +282,8 @@ class ModelLoader:
         model = self.normalize_model(model, target_size=0.8)
 
         info = self.get_model_info(model)
+        if share:
+            info["shared"] = self.export_shared(model)
         return model, info
 
     def is_available(self) -> bool:
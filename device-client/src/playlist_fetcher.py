@@ -4,17 +4,43 @@ Playlist Fetcher
 Fetch playlists and playlist items from the HoloHub backend.
 Handles authentication, caching, and error recovery.
 """
+import json
 import logging
+import random
+import threading
 import time
-from typing import Optional, List, Dict, Any
+from collections import deque
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+from .api_client import PLAYLIST_NOT_MODIFIED
+
+# Optional msgspec for decoding playlist responses straight into dataclasses
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
 
 
 logger = logging.getLogger(__name__)
 
+# Poll interval growth after consecutive fetch failures, and its ceiling
+POLL_BACKOFF_FACTOR = 2
+MAX_POLL_INTERVAL_SEC = 900
+
+# Each wait is scaled by a random factor within +/- this fraction, so a
+# fleet started together doesn't poll the backend in lockstep
+POLL_JITTER = 0.1
+
+# Adaptive polling: target polls per expected gap between playlist changes,
+# how many recent gaps to keep, and how many are needed before adapting
+POLLS_PER_CHANGE = 10
+CHANGE_HISTORY_SIZE = 20
+MIN_CHANGE_SAMPLES = 3
 
-@dataclass
+
+@dataclass(slots=True)
 class PlaylistItem:
     """Playlist item data."""
 
@@ -25,11 +51,11 @@ class PlaylistItem:
     asset_file_path: str
     asset_file_size: int
     asset_mime_type: str
-    custom_settings: Dict[str, Any]
+    custom_settings: Dict[str, Any] = field(default_factory=dict)
     transition_override: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Playlist:
     """Playlist data."""
 
@@ -44,6 +70,20 @@ class Playlist:
     total_duration_sec: Optional[int]
     item_count: int
     items: List[PlaylistItem]
+    # (asset_id, duration_seconds) per item and its hash, for change checks
+    content_key: Tuple[Tuple[str, int], ...] = field(default=(), init=False, repr=False, compare=False)
+    content_hash: int = field(default=0, init=False, repr=False, compare=False)
+    # Item id -> position in items
+    item_index: Dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.content_key = tuple((item.asset_id, item.duration_seconds) for item in self.items)
+        self.content_hash = hash(self.content_key)
+        self.item_index = {item.id: i for i, item in enumerate(self.items)}
+
+
+if msgspec is not None:
+    _playlist_decoder = msgspec.json.Decoder(Playlist)
 
 
 class PlaylistFetcher:
@@ -51,19 +91,38 @@ class PlaylistFetcher:
     Fetch and manage playlists from the backend.
     """
 
-    def __init__(self, api_client, polling_interval_sec: int = 60):
+    def __init__(self, api_client, polling_interval_sec: int = 60, adaptive_polling: bool = False):
         """
         Initialize playlist fetcher.
 
         Args:
             api_client: DeviceAPIClient instance
             polling_interval_sec: How often to check for playlist updates
+            adaptive_polling: Stretch the interval for playlists that rarely
+                change, based on the observed time between changes;
+                polling_interval_sec is then the shortest interval used
         """
         self.api_client = api_client
         self.polling_interval_sec = polling_interval_sec
+        self.adaptive_polling = adaptive_polling
         self.current_playlist: Optional[Playlist] = None
         self.last_fetch_time: Optional[datetime] = None
         self.device_id: Optional[str] = None
+        # Backoff state; failed fetches stretch the interval until one succeeds
+        self._last_attempt_time: Optional[datetime] = None
+        self._consecutive_failures = 0
+        self._current_interval = polling_interval_sec
+        # Jitter factor for the wait after the latest attempt; the RNG is
+        # seeded from the device id so a device keeps its spread across restarts
+        self._jitter_rng = random.Random()
+        self._jitter_factor = 1.0
+        # ETag of current_playlist, sent as If-None-Match on the next poll
+        self._last_etag: Optional[str] = None
+        # Set to cut wait_for_next_poll() short
+        self._wake_event = threading.Event()
+        # Monotonic time of the last detected change and recent gaps between changes
+        self._last_change_time: Optional[float] = None
+        self._change_gaps: deque = deque(maxlen=CHANGE_HISTORY_SIZE)
 
     def fetch_assigned_playlist(self, device_id: str) -> Optional[Playlist]:
         """
@@ -75,7 +134,11 @@ class PlaylistFetcher:
         Returns:
             Playlist object or None if no playlist assigned
         """
+        if device_id != self.device_id:
+            self._jitter_rng.seed(device_id)
         self.device_id = device_id
+        self._last_attempt_time = datetime.now()
+        self._jitter_factor = self._jitter_rng.uniform(1 - POLL_JITTER, 1 + POLL_JITTER)
 
         try:
             # Ensure we're authenticated
@@ -83,56 +146,152 @@ class PlaylistFetcher:
                 logger.info("Not authenticated, fetching device token...")
                 self.api_client.authenticate()
 
-            # Fetch playlist from backend
+            # Fetch playlist from backend; unchanged playlists come back as 304
             logger.info(f"Fetching playlist for device {device_id}...")
-            response = self.api_client.get_assigned_playlist()
+            etag = self._last_etag if self.current_playlist is not None else None
+            response = self.api_client.get_assigned_playlist(
+                if_none_match=etag, raw=msgspec is not None
+            )
+
+            if response is PLAYLIST_NOT_MODIFIED:
+                logger.debug("Playlist not modified")
+                self.last_fetch_time = datetime.now()
+                self._reset_backoff()
+                return self.current_playlist
 
             if response is None:
                 logger.info("No playlist assigned to this device")
                 self.current_playlist = None
+                self._reset_backoff()
                 return None
 
-            # Parse response
-            items = []
-            for item_data in response.get("items", []):
-                item = PlaylistItem(
-                    id=item_data["id"],
-                    asset_id=item_data["asset_id"],
-                    position=item_data["position"],
-                    duration_seconds=item_data["duration_seconds"],
-                    asset_file_path=item_data["asset_file_path"],
-                    asset_file_size=item_data["asset_file_size"],
-                    asset_mime_type=item_data["asset_mime_type"],
-                    custom_settings=item_data.get("custom_settings", {}),
-                    transition_override=item_data.get("transition_override"),
-                )
-                items.append(item)
-
-            playlist = Playlist(
-                id=response["id"],
-                name=response["name"],
-                description=response.get("description"),
-                loop_mode=response["loop_mode"],
-                shuffle=response["shuffle"],
-                transition_type=response["transition_type"],
-                transition_duration_ms=response["transition_duration_ms"],
-                is_active=response["is_active"],
-                total_duration_sec=response.get("total_duration_sec"),
-                item_count=response["item_count"],
-                items=items,
-            )
+            if isinstance(response, bytes):
+                playlist = self._decode_playlist(response)
+            else:
+                playlist = self._parse_playlist(response)
 
+            if self.current_playlist is not None and self.has_playlist_changed(playlist):
+                self._record_change()
             self.current_playlist = playlist
             self.last_fetch_time = datetime.now()
+            self._last_etag = self.api_client.playlist_etag
+            self._reset_backoff()
 
             logger.info(f"Fetched playlist '{playlist.name}' with {playlist.item_count} items")
             return playlist
 
         except Exception as e:
-            logger.error(f"Failed to fetch playlist: {e}")
+            self._consecutive_failures += 1
+            self._current_interval = min(
+                self._current_interval * POLL_BACKOFF_FACTOR, MAX_POLL_INTERVAL_SEC
+            )
+            logger.error(
+                f"Failed to fetch playlist ({self._consecutive_failures} in a row, "
+                f"next attempt in {self._current_interval}s): {e}"
+            )
             self.current_playlist = None
             return None
 
+    def _decode_playlist(self, raw: bytes) -> Playlist:
+        """
+        Decode a raw playlist response with msgspec.
+
+        Responses that don't match the dataclasses (e.g. a missing field
+        that _parse_playlist() defaults) go through the dict path instead.
+
+        Args:
+            raw: JSON response body
+
+        Returns:
+            Playlist object
+        """
+        try:
+            return _playlist_decoder.decode(raw)
+        except msgspec.DecodeError as e:
+            logger.debug(f"Fast playlist decode failed, falling back to json: {e}")
+            return self._parse_playlist(json.loads(raw))
+
+    def _parse_playlist(self, response: Dict[str, Any]) -> Playlist:
+        """
+        Build a Playlist from decoded response data.
+
+        Args:
+            response: Playlist data from the backend
+
+        Returns:
+            Playlist object
+        """
+        items = []
+        for item_data in response.get("items", []):
+            item = PlaylistItem(
+                id=item_data["id"],
+                asset_id=item_data["asset_id"],
+                position=item_data["position"],
+                duration_seconds=item_data["duration_seconds"],
+                asset_file_path=item_data["asset_file_path"],
+                asset_file_size=item_data["asset_file_size"],
+                asset_mime_type=item_data["asset_mime_type"],
+                custom_settings=item_data.get("custom_settings", {}),
+                transition_override=item_data.get("transition_override"),
+            )
+            items.append(item)
+
+        return Playlist(
+            id=response["id"],
+            name=response["name"],
+            description=response.get("description"),
+            loop_mode=response["loop_mode"],
+            shuffle=response["shuffle"],
+            transition_type=response["transition_type"],
+            transition_duration_ms=response["transition_duration_ms"],
+            is_active=response["is_active"],
+            total_duration_sec=response.get("total_duration_sec"),
+            item_count=response["item_count"],
+            items=items,
+        )
+
+    def _reset_backoff(self) -> None:
+        """Return to the normal polling interval after a successful fetch."""
+        self._consecutive_failures = 0
+        self._current_interval = self._base_interval()
+
+    def _record_change(self) -> None:
+        """Note that a playlist change was detected by the current poll."""
+        now = time.monotonic()
+        if self._last_change_time is not None:
+            self._change_gaps.append(now - self._last_change_time)
+        self._last_change_time = now
+
+    def _base_interval(self) -> float:
+        """
+        Get the polling interval to use while fetches succeed.
+
+        With adaptive polling, changes are modelled as a Poisson process
+        whose rate is fitted from recent gaps (exponential MLE, 1 / mean).
+        Being memoryless, its best placement for a poll budget is even
+        spacing, so the interval is the mean gap split into
+        POLLS_PER_CHANGE polls, clamped to [polling_interval_sec,
+        MAX_POLL_INTERVAL_SEC].
+
+        Returns:
+            Interval in seconds
+        """
+        if not self.adaptive_polling or len(self._change_gaps) < MIN_CHANGE_SAMPLES:
+            return self.polling_interval_sec
+
+        mean_gap = sum(self._change_gaps) / len(self._change_gaps)
+        interval = mean_gap / POLLS_PER_CHANGE
+        return min(max(interval, self.polling_interval_sec), MAX_POLL_INTERVAL_SEC)
+
+    def _next_poll_delay(self) -> float:
+        """
+        Get the jittered wait between the latest attempt and the next poll.
+
+        Returns:
+            Delay in seconds, at most MAX_POLL_INTERVAL_SEC
+        """
+        return min(self._current_interval * self._jitter_factor, MAX_POLL_INTERVAL_SEC)
+
     def has_playlist_changed(self, new_playlist: Playlist) -> bool:
         """
         Check if playlist has changed since last fetch.
@@ -149,6 +308,10 @@ class PlaylistFetcher:
         if new_playlist is None:
             return True
 
+        # A 304 poll hands back the very same object
+        if new_playlist is self.current_playlist:
+            return False
+
         # Compare basic properties
         if self.current_playlist.id != new_playlist.id:
             return True
@@ -156,30 +319,68 @@ class PlaylistFetcher:
         if self.current_playlist.item_count != new_playlist.item_count:
             return True
 
-        # Compare items
-        if len(self.current_playlist.items) != len(new_playlist.items):
+        # Compare items by their precomputed (asset_id, duration) hash
+        if self.current_playlist.content_hash != new_playlist.content_hash:
             return True
 
-        for current_item, new_item in zip(self.current_playlist.items, new_playlist.items):
-            if current_item.asset_id != new_item.asset_id:
-                return True
-            if current_item.duration_seconds != new_item.duration_seconds:
-                return True
-
+        # Equal hashes: verify item by item rather than trusting the hash
+        if self.current_playlist.content_key != new_playlist.content_key:
+            logger.warning(f"Playlist {new_playlist.id} content hash collision; items differ")
+            return True
         return False
 
     def should_refresh(self) -> bool:
         """
         Check if playlist should be refreshed based on time.
 
+        The interval grows exponentially while fetches keep failing, and
+        with adaptive polling it follows how often the playlist changes.
+        Each wait is jittered by up to POLL_JITTER either way.
+
         Returns:
             True if refresh is needed
         """
-        if self.last_fetch_time is None:
+        if self._last_attempt_time is None:
             return True
 
-        elapsed = (datetime.now() - self.last_fetch_time).total_seconds()
-        return elapsed >= self.polling_interval_sec
+        elapsed = (datetime.now() - self._last_attempt_time).total_seconds()
+        return elapsed >= self._next_poll_delay()
+
+    def wait_for_next_poll(self) -> bool:
+        """
+        Block until the next poll is due.
+
+        Returns early when trigger_refresh() or set_polling_interval() is
+        called from another thread.
+
+        Returns:
+            True if woken early, False if the interval elapsed
+        """
+        if self._last_attempt_time is None:
+            timeout = 0.0
+        else:
+            elapsed = (datetime.now() - self._last_attempt_time).total_seconds()
+            timeout = max(0.0, self._next_poll_delay() - elapsed)
+        woken = self._wake_event.wait(timeout=timeout)
+        self._wake_event.clear()
+        return woken
+
+    def trigger_refresh(self) -> None:
+        """Make the next poll due now and wake any waiter."""
+        self._last_attempt_time = None
+        self._wake_event.set()
+
+    def set_polling_interval(self, polling_interval_sec: int) -> None:
+        """
+        Change the polling interval, waking any waiter so it takes effect.
+
+        Args:
+            polling_interval_sec: New interval between playlist checks
+        """
+        self.polling_interval_sec = polling_interval_sec
+        if self._consecutive_failures == 0:
+            self._current_interval = self._base_interval()
+        self._wake_event.set()
 
     def get_current_item(self) -> Optional[PlaylistItem]:
         """
@@ -232,15 +433,15 @@ class PlaylistFetcher:
             return None
 
         # Find current item index
-        for i, item in enumerate(items):
-            if item.id == current_item_id:
-                # Return next item, or first if at end
-                if self.current_playlist.loop_mode:
-                    return items[(i + 1) % len(items)]
-                elif i < len(items) - 1:
-                    return items[i + 1]
-                else:
-                    return None  # End of non-looping playlist
-
-        # If current item not found, return first
-        return items[0] if items else None
+        i = self.current_playlist.item_index.get(current_item_id)
+        if i is None:
+            # If current item not found, return first
+            return items[0]
+
+        # Return next item, or first if at end
+        if self.current_playlist.loop_mode:
+            return items[(i + 1) % len(items)]
+        elif i < len(items) - 1:
+            return items[i + 1]
+        else:
+            return None  # End of non-looping playlist
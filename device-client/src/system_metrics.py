@@ -4,16 +4,61 @@ System Metrics Collector
 Collects system health metrics for device heartbeat.
 Compatible with Raspberry Pi, Linux systems, and Windows.
 """
+import functools
+import os
 import platform
 import logging
 import subprocess
 import time
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed
+from typing import Any, Dict, Optional, Tuple
 from pathlib import Path
 
+# Optional psutil - portable metrics when installed
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
 
 logger = logging.getLogger(__name__)
 
+# Total time get_all_metrics() waits for its collectors
+METRICS_DEADLINE_SEC = 2.0
+
+# Board fields read from /proc/cpuinfo
+_CPUINFO_FIELDS = ("Hardware", "Revision", "Model")
+
+# Raspberry Pi SoC temperature, in millidegrees Celsius
+_RPI_TEMP_PATH = "/sys/class/thermal/thermal_zone0/temp"
+
+
+def _ttl_cached(seconds: float):
+    """
+    Reuse a collector's last result for the given number of seconds.
+
+    Results are stored per instance in self._metric_cache, keyed by
+    method name.
+
+    Args:
+        seconds: How long a result stays fresh
+    """
+    def decorator(method):
+        name = method.__name__
+
+        @functools.wraps(method)
+        def wrapper(self):
+            now = time.monotonic()
+            cached = self._metric_cache.get(name)
+            if cached is not None and now - cached[1] < seconds:
+                return cached[0]
+            value = method(self)
+            self._metric_cache[name] = (value, now)
+            return value
+        return wrapper
+    return decorator
+
 
 class SystemMetrics:
     """
@@ -27,10 +72,48 @@ class SystemMetrics:
 
     def __init__(self):
         self.system = platform.system().lower()
+        self._cpuinfo = self._read_cpuinfo()
         self.is_raspberry_pi = self._detect_raspberry_pi()
+        # Hardware info never changes while running; built on first request
+        self._device_info_cache: Optional[dict] = None
+        # (idle, total) jiffies from the previous /proc/stat read
+        self._prev_cpu: Optional[Tuple[int, int]] = None
+        # Kept-alive HTTP client for latency probes, created on first use
+        self._http = None
+        # Collector name -> (value, monotonic time), see _ttl_cached
+        self._metric_cache: Dict[str, Tuple[Any, float]] = {}
+        # Thermal sensor kept open between reads on Raspberry Pi, opened on first use
+        self._temp_fd: Optional[int] = None
+        # Runs the collectors that can block (sensors, latency probe), created
+        # on first use so the instance keeps working after close()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _read_cpuinfo(self) -> Dict[str, str]:
+        """
+        Read the board fields of /proc/cpuinfo once.
+
+        Returns:
+            Hardware/Revision/Model values present in the file
+        """
+        fields = {}
+        try:
+            with open("/proc/cpuinfo", "r") as f:
+                # Stream lines and stop once every wanted field is found
+                for line in f:
+                    key, sep, value = line.partition(":")
+                    key = key.strip()
+                    if sep and key in _CPUINFO_FIELDS:
+                        fields[key] = value.strip()
+                        if len(fields) == len(_CPUINFO_FIELDS):
+                            break
+        except IOError:
+            pass
+        return fields
 
     def _detect_raspberry_pi(self) -> bool:
         """Detect if running on Raspberry Pi."""
+        if "raspberry pi" in self._cpuinfo.get("Model", "").lower():
+            return True
         try:
             if Path("/proc/device-tree/model").exists():
                 with open("/proc/device-tree/model", "r") as f:
@@ -39,16 +122,48 @@ class SystemMetrics:
             pass
         return False
 
+    def _read_proc_stat(self) -> Tuple[int, int]:
+        """
+        Read aggregate CPU times from /proc/stat.
+
+        Returns:
+            Tuple of (idle jiffies, total jiffies)
+        """
+        with open("/proc/stat", "r") as f:
+            fields = f.readline().split()
+        user, nice, system, idle, iowait, irq, softirq, steal = (int(v) for v in fields[1:9])
+        idle_total = idle + iowait
+        return idle_total, idle_total + user + nice + system + irq + softirq + steal
+
+    @_ttl_cached(1)
     def get_cpu_percent(self) -> Optional[float]:
         """
         Get CPU usage percentage.
 
+        On Linux this is the usage since the previous call, from /proc/stat.
+
         Returns:
             CPU usage as percentage (0-100) or None if unavailable
         """
+        if self.system == "linux":
+            try:
+                if self._prev_cpu is None:
+                    # First call: take a short baseline sample
+                    self._prev_cpu = self._read_proc_stat()
+                    time.sleep(0.1)
+                idle, total = self._read_proc_stat()
+                prev_idle, prev_total = self._prev_cpu
+                self._prev_cpu = (idle, total)
+                total_delta = total - prev_total
+                if total_delta > 0:
+                    return (total_delta - (idle - prev_idle)) / total_delta * 100.0
+                return 0.0
+            except (IOError, ValueError) as e:
+                logger.debug(f"Could not read /proc/stat: {e}")
+
         try:
-            if self.system in ("linux", "darwin"):
-                # Use top for Linux/macOS
+            if self.system == "darwin":
+                # Use top for macOS
                 result = subprocess.run(
                     ["top", "-bn1"],
                     capture_output=True,
@@ -83,14 +198,12 @@ class SystemMetrics:
             logger.debug(f"Could not get CPU usage: {e}")
 
         # Fallback: use psutil if available
-        try:
-            import psutil
+        if PSUTIL_AVAILABLE:
             return psutil.cpu_percent(interval=0.1)
-        except ImportError:
-            pass
 
         return None
 
+    @_ttl_cached(2)
     def get_memory_percent(self) -> Optional[float]:
         """
         Get memory usage percentage.
@@ -98,33 +211,29 @@ class SystemMetrics:
         Returns:
             Memory usage as percentage (0-100) or None if unavailable
         """
-        try:
-            # Try psutil first (works on all platforms)
-            import psutil
+        # Try psutil first (works on all platforms)
+        if PSUTIL_AVAILABLE:
             return psutil.virtual_memory().percent
-        except ImportError:
-            pass
 
-        # Fallback to platform-specific methods
-        try:
-            if self.system == "linux":
-                result = subprocess.run(
-                    ["free", "-m"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                )
-                for line in result.stdout.split("\n"):
-                    if "Mem:" in line:
-                        parts = line.split()
-                        total = float(parts[1])
-                        used = float(parts[2])
-                        return (used / total) * 100
-        except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError) as e:
-            logger.debug(f"Could not get memory usage: {e}")
+        # Fallback: read the kernel's counters directly
+        if self.system == "linux":
+            try:
+                fields = {}
+                with open("/proc/meminfo", "r") as f:
+                    for line in f:
+                        key, _, value = line.partition(":")
+                        if key in ("MemTotal", "MemAvailable"):
+                            fields[key] = int(value.split()[0])
+                            if len(fields) == 2:
+                                break
+                total = fields["MemTotal"]
+                return (1 - fields["MemAvailable"] / total) * 100
+            except (IOError, KeyError, ValueError, ZeroDivisionError) as e:
+                logger.debug(f"Could not get memory usage: {e}")
 
         return None
 
+    @_ttl_cached(30)
     def get_storage_used_gb(self) -> Optional[float]:
         """
         Get storage used in GB.
@@ -132,35 +241,22 @@ class SystemMetrics:
         Returns:
             Storage used in GB or None if unavailable
         """
-        try:
-            import psutil
+        if PSUTIL_AVAILABLE:
             usage = psutil.disk_usage("/")
             return usage.used / (1024**3)  # Convert to GB
-        except ImportError:
-            pass
 
-        try:
-            if self.system == "linux":
-                result = subprocess.run(
-                    ["df", "-h", "/"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                )
-                for line in result.stdout.split("\n"):
-                    if line.startswith("/dev/"):
-                        parts = line.split()
-                        if len(parts) >= 4:
-                            used_str = parts[2]
-                            if used_str.endswith("G"):
-                                return float(used_str.rstrip("G"))
-                            elif used_str.endswith("M"):
-                                return float(used_str.rstrip("M")) / 1024
-        except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError) as e:
-            logger.debug(f"Could not get storage usage: {e}")
+        # Fallback: statvfs on POSIX systems
+        if hasattr(os, "statvfs"):
+            try:
+                stat = os.statvfs("/")
+                used = (stat.f_blocks - stat.f_bfree) * stat.f_frsize
+                return used / (1024**3)
+            except OSError as e:
+                logger.debug(f"Could not get storage usage: {e}")
 
         return None
 
+    @_ttl_cached(5)
     def get_temperature_celsius(self) -> Optional[int]:
         """
         Get CPU temperature in Celsius.
@@ -168,26 +264,27 @@ class SystemMetrics:
         Returns:
             Temperature in Celsius or None if unavailable
         """
-        if self.is_raspberry_pi:
+        if self.is_raspberry_pi and self._temp_fd is None:
             try:
-                # Raspberry Pi specific
-                with open("/sys/class/thermal/thermal_zone0/temp", "r") as f:
-                    temp_millidegrees = int(f.read().strip())
-                    return temp_millidegrees // 1000
-            except (IOError, ValueError) as e:
+                self._temp_fd = os.open(_RPI_TEMP_PATH, os.O_RDONLY)
+            except OSError as e:
+                logger.debug(f"Could not open {_RPI_TEMP_PATH}: {e}")
+
+        if self._temp_fd is not None:
+            try:
+                # Raspberry Pi specific; sysfs regenerates the value on each read from offset 0
+                temp_millidegrees = int(os.pread(self._temp_fd, 16, 0))
+                return temp_millidegrees // 1000
+            except (OSError, ValueError) as e:
                 logger.debug(f"Could not get RPi temperature: {e}")
 
-        try:
-            import psutil
-            if hasattr(psutil, "sensors_temperatures"):
-                temps = psutil.sensors_temperatures()
-                if temps:
-                    # Get first available temperature
-                    for name, entries in temps.items():
-                        if entries:
-                            return int(entries[0].current)
-        except ImportError:
-            pass
+        if PSUTIL_AVAILABLE and hasattr(psutil, "sensors_temperatures"):
+            temps = psutil.sensors_temperatures()
+            if temps:
+                # Get first available temperature
+                for name, entries in temps.items():
+                    if entries:
+                        return int(entries[0].current)
 
         return None
 
@@ -195,6 +292,9 @@ class SystemMetrics:
         """
         Get network latency to backend server in milliseconds.
 
+        The connection is reused between calls, so after the first probe
+        this measures the request round trip rather than connection setup.
+
         Args:
             api_base_url: Backend server URL
 
@@ -202,14 +302,13 @@ class SystemMetrics:
             Latency in ms or None if unavailable
         """
         try:
-            import httpx
-            start = time.time()
-            response = httpx.get(
-                f"{api_base_url.rstrip('/')}/health",
-                timeout=5,
-            )
+            if self._http is None:
+                import httpx
+                self._http = httpx.Client(timeout=5)
+            start = time.perf_counter()
+            response = self._http.get(f"{api_base_url.rstrip('/')}/health")
             response.raise_for_status()
-            latency_ms = int((time.time() - start) * 1000)
+            latency_ms = int((time.perf_counter() - start) * 1000)
             return latency_ms
         except Exception as e:
             logger.debug(f"Could not measure latency: {e}")
@@ -228,26 +327,48 @@ class SystemMetrics:
         # For now, return None or a simulated value
         return None
 
-    def get_all_metrics(self, api_base_url: Optional[str] = None) -> dict:
+    def get_all_metrics(
+        self, api_base_url: Optional[str] = None, deadline_sec: float = METRICS_DEADLINE_SEC
+    ) -> dict:
         """
         Get all available system metrics.
 
+        The temperature and latency collectors, which can block, run on a
+        background pool; any that has not finished within deadline_sec is
+        left out of the result. The cheap /proc and statvfs reads run inline.
+
         Args:
             api_base_url: Optional backend URL for latency check
+            deadline_sec: Total time to wait for the collectors
 
         Returns:
             Dictionary of metrics
         """
+        start = time.monotonic()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="metrics")
+        futures = {self._executor.submit(self.get_temperature_celsius): "temperature_celsius"}
+        if api_base_url:
+            futures[self._executor.submit(self.get_network_latency_ms, api_base_url)] = "latency_ms"
+
         metrics = {
             "cpu_usage_percent": self.get_cpu_percent(),
             "memory_usage_percent": self.get_memory_percent(),
             "storage_used_gb": self.get_storage_used_gb(),
-            "temperature_celsius": self.get_temperature_celsius(),
             "bandwidth_mbps": self.get_bandwidth_mbps(),
         }
 
-        if api_base_url:
-            metrics["latency_ms"] = self.get_network_latency_ms(api_base_url)
+        remaining = max(0.0, deadline_sec - (time.monotonic() - start))
+        try:
+            for future in as_completed(futures, timeout=remaining):
+                try:
+                    metrics[futures[future]] = future.result()
+                except Exception as e:
+                    logger.debug(f"Could not collect {futures[future]}: {e}")
+        except FuturesTimeoutError:
+            # Stragglers keep running; their results are dropped
+            pending = sorted(name for future, name in futures.items() if not future.done())
+            logger.debug(f"Metrics not ready after {deadline_sec}s: {', '.join(pending)}")
 
         # Remove None values
         return {k: v for k, v in metrics.items() if v is not None}
@@ -259,6 +380,9 @@ class SystemMetrics:
         Returns:
             Device information dictionary
         """
+        if self._device_info_cache is not None:
+            return dict(self._device_info_cache)
+
         info = {
             "platform": platform.platform(),
             "system": self.system,
@@ -269,19 +393,29 @@ class SystemMetrics:
 
         # Get Raspberry Pi specific info
         if self.is_raspberry_pi:
-            try:
-                # Get CPU info
-                with open("/proc/cpuinfo", "r") as f:
-                    cpuinfo = f.read()
-                    for line in cpuinfo.split("\n"):
-                        if line.startswith("Hardware"):
-                            info["hardware"] = line.split(":", 1)[1].strip()
-                        elif line.startswith("Revision"):
-                            info["revision"] = line.split(":", 1)[1].strip()
-            except IOError:
-                pass
-
-        return info
+            if "Hardware" in self._cpuinfo:
+                info["hardware"] = self._cpuinfo["Hardware"]
+            if "Revision" in self._cpuinfo:
+                info["revision"] = self._cpuinfo["Revision"]
+
+        self._device_info_cache = info
+        return dict(info)
+
+    def close(self) -> None:
+        """
+        Stop the collector pool and close the HTTP client and thermal sensor.
+
+        Each is recreated on demand, so the instance stays usable afterwards.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+        if self._temp_fd is not None:
+            os.close(self._temp_fd)
+            self._temp_fd = None
 
 
 # Singleton instance
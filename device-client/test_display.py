@@ -15,12 +15,15 @@ try:
     from OpenGL.GL import (
         GL_DEPTH_TEST, GL_PROJECTION, GL_MODELVIEW,
         GL_COLOR_BUFFER_BIT, GL_DEPTH_BUFFER_BIT, GL_TRIANGLES,
+        GL_ARRAY_BUFFER, GL_STATIC_DRAW, GL_VERTEX_ARRAY, GL_COLOR_ARRAY,
+        GL_FLOAT, GL_UNSIGNED_BYTE,
         glEnable, glClearColor, glMatrixMode, glLoadIdentity, glRotatef,
-        glBegin, glEnd, glNormal3f, glColor3f, glVertex3f, glClear, glFlush,
+        glClear, glFlush, glGenBuffers, glBindBuffer, glBufferData,
+        glEnableClientState, glDisableClientState, glVertexPointer, glColorPointer,
+        glDrawArrays,
     )
     from OpenGL.GLU import gluPerspective, gluLookAt
     import numpy as np
-    import time
 
     # Load the test model
     test_file = Path(__file__).parent / "test_box.glb"
@@ -71,6 +74,29 @@ try:
     glEnable(GL_DEPTH_TEST)
     glClearColor(0.2, 0.2, 0.3, 1.0)  # Blue-ish background
 
+    # Upload each geometry once as flat per-corner arrays: (vertex VBO, color VBO, count)
+    buffers = []
+    for geom in scene.geometry.values():
+        faces = geom.faces
+        # Cast the shared vertices once, then gather every triangle corner with one fancy index
+        flat_vertices = np.asarray(geom.vertices, dtype=np.float32)[faces.ravel()]
+
+        # Get colors (RGBA bytes per face) or use default
+        colors = None
+        if hasattr(geom, 'visual') and hasattr(geom.visual, 'face_colors'):
+            colors = np.asarray(geom.visual.face_colors, dtype=np.uint8)
+        if colors is None or colors.shape != (len(faces), 4):
+            colors = np.tile(np.array([255, 128, 0, 255], dtype=np.uint8), (len(faces), 1))  # Orange
+        flat_colors = np.ascontiguousarray(np.repeat(colors, 3, axis=0))
+
+        vertex_vbo, color_vbo = glGenBuffers(2)
+        glBindBuffer(GL_ARRAY_BUFFER, vertex_vbo)
+        glBufferData(GL_ARRAY_BUFFER, flat_vertices.nbytes, flat_vertices, GL_STATIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, color_vbo)
+        glBufferData(GL_ARRAY_BUFFER, flat_colors.nbytes, flat_colors, GL_STATIC_DRAW)
+        buffers.append((vertex_vbo, color_vbo, len(flat_vertices)))
+    glBindBuffer(GL_ARRAY_BUFFER, 0)
+
     rotation = 0.0
 
     def render_scene():
@@ -89,33 +115,18 @@ try:
         glRotatef(rotation, 0, 1, 0)
         glRotatef(20, 1, 0, 0)
 
-        # Render each geometry
-        for geom in scene.geometry.values():
-            vertices = geom.vertices
-            faces = geom.faces
-
-            # Get colors or use default
-            if hasattr(geom, 'visual') and hasattr(geom.visual, 'face_colors'):
-                colors = geom.visual.face_colors
-            else:
-                colors = np.ones((len(faces), 3), dtype=np.float32) * [1.0, 0.5, 0.0]  # Orange
-
-            # Draw faces
-            for i, face in enumerate(faces):
-                v0, v1, v2 = vertices[face[0]], vertices[face[1]], vertices[face[2]]
-
-                if i < len(colors):
-                    c = colors[i]
-                    glColor3f(c[0], c[1], c[2])
-                else:
-                    glColor3f(1.0, 0.5, 0.0)
-
-                glBegin(GL_TRIANGLES)
-                glNormal3f(0, 0, 1)
-                glVertex3f(v0[0], v0[1], v0[2])
-                glVertex3f(v1[0], v1[1], v1[2])
-                glVertex3f(v2[0], v2[1], v2[2])
-                glEnd()
+        # Render each geometry with a single draw call
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_COLOR_ARRAY)
+        for vertex_vbo, color_vbo, count in buffers:
+            glBindBuffer(GL_ARRAY_BUFFER, vertex_vbo)
+            glVertexPointer(3, GL_FLOAT, 0, None)
+            glBindBuffer(GL_ARRAY_BUFFER, color_vbo)
+            glColorPointer(4, GL_UNSIGNED_BYTE, 0, None)
+            glDrawArrays(GL_TRIANGLES, 0, count)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
 
         glFlush()
 
@@ -123,27 +134,20 @@ try:
 
     print("Window created. Press ESC to exit.")
 
-    # Use a list to allow mutation in event handlers
-    running = [True]
-
     @window.event
     def on_key_press(symbol, modifiers):
         if symbol == pyglet.window.key.ESCAPE:
-            running[0] = False
+            window.close()
 
-    @window.event
-    def on_close():
-        running[0] = False
-
-    # Main loop
-    while running[0]:
-        pyglet.clock.tick()
-        rotation += 0.5
-        window.switch_to()
-        window.dispatch_events()
-        render_scene()
-        window.flip()
-        time.sleep(0.016)
+    def update(dt):
+        global rotation
+        # 0.5 degrees per 60 Hz frame, independent of the actual frame rate
+        rotation += 0.5 * (dt * 60)
+
+    # pyglet's event loop redraws the window after each tick and exits
+    # once it is closed
+    pyglet.clock.schedule_interval(update, 1 / 60)
+    pyglet.app.run()
 
     print("Test complete.")
 
@@ -0,0 +1,108 @@
+"""
+Playlist fetcher tests.
+
+Drives PlaylistFetcher against a mocked backend to check polling backoff.
+"""
+import sys
+from datetime import datetime, timedelta
+from functools import partial
+from pathlib import Path
+
+import httpx
+import pytest
+
+# Add device client to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src import playlist_fetcher
+from src.api_client import DeviceAPIClient
+from src.playlist_fetcher import MAX_POLL_INTERVAL_SEC, PlaylistFetcher
+
+
+class _Clock:
+    """Stand-in for datetime whose now() only moves when told to."""
+
+    current = datetime(2024, 1, 1)
+
+    @classmethod
+    def now(cls):
+        return cls.current
+
+    @classmethod
+    def advance(cls, seconds: float) -> None:
+        cls.current += timedelta(seconds=seconds)
+
+
+@pytest.fixture
+def make_fetcher(monkeypatch):
+    """Build fetchers backed by a mock transport, with a fake clock and no jitter."""
+    monkeypatch.setattr(playlist_fetcher, "datetime", _Clock)
+    monkeypatch.setattr(playlist_fetcher, "POLL_JITTER", 0)
+
+    def make(playlist_handler) -> PlaylistFetcher:
+        def handler(request):
+            if request.url.path == "/api/v1/devices/auth":
+                return httpx.Response(
+                    200,
+                    json={"access_token": "token", "device_id": "device-1", "expires_in": 3600},
+                )
+            return playlist_handler(request)
+
+        monkeypatch.setattr(
+            httpx, "Client", partial(httpx.Client, transport=httpx.MockTransport(handler))
+        )
+        client = DeviceAPIClient(
+            api_base_url="http://backend.test",
+            hardware_id="HP-TEST-001",
+            device_secret="secret",
+        )
+        return PlaylistFetcher(api_client=client, polling_interval_sec=60)
+
+    return make
+
+
+def poll_delay(fetcher: PlaylistFetcher) -> int:
+    """Seconds after the latest fetch until should_refresh() turns True."""
+    start = _Clock.current
+    try:
+        for elapsed in range(2 * MAX_POLL_INTERVAL_SEC):
+            _Clock.current = start + timedelta(seconds=elapsed)
+            if fetcher.should_refresh():
+                return elapsed
+        raise AssertionError("poll never became due")
+    finally:
+        _Clock.current = start
+
+
+def test_backoff_grows_on_connection_errors(make_fetcher):
+    """Transport errors count as failures and stretch the poll interval."""
+    def handler(request):
+        raise httpx.ConnectError("connection refused", request=request)
+
+    fetcher = make_fetcher(handler)
+    for expected in (120, 240, 480, MAX_POLL_INTERVAL_SEC, MAX_POLL_INTERVAL_SEC):
+        assert fetcher.fetch_assigned_playlist("device-1") is None
+        assert poll_delay(fetcher) == expected
+
+
+def test_backoff_grows_on_server_errors(make_fetcher):
+    """5xx responses count as failures, not as 'no playlist assigned'."""
+    fetcher = make_fetcher(lambda request: httpx.Response(503))
+
+    fetcher.fetch_assigned_playlist("device-1")
+    assert poll_delay(fetcher) == 120
+
+    fetcher.fetch_assigned_playlist("device-1")
+    assert poll_delay(fetcher) == 240
+
+
+def test_backoff_resets_when_no_playlist_assigned(make_fetcher):
+    """A 404 is a successful answer and ends the backoff."""
+    responses = [httpx.Response(503), httpx.Response(404)]
+    fetcher = make_fetcher(lambda request: responses.pop(0))
+
+    fetcher.fetch_assigned_playlist("device-1")
+    assert poll_delay(fetcher) == 120
+
+    assert fetcher.fetch_assigned_playlist("device-1") is None
+    assert poll_delay(fetcher) == 60
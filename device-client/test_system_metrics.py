@@ -0,0 +1,40 @@
+"""
+System metrics tests.
+
+Checks that the shared metrics collector keeps working after close().
+"""
+import sys
+from pathlib import Path
+
+# Add device client to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src import system_metrics
+from src.system_metrics import SystemMetrics, get_system_metrics
+
+
+def test_collect_after_close():
+    """close() on the shared instance doesn't break later heartbeats."""
+    metrics = get_system_metrics()
+    first = metrics.get_all_metrics()
+
+    metrics.close()
+    second = metrics.get_all_metrics()
+
+    assert isinstance(second, dict)
+    assert set(second) == set(first)
+    metrics.close()
+
+
+def test_rpi_temperature_after_close(tmp_path, monkeypatch):
+    """The thermal sensor is reopened when read after close()."""
+    sensor = tmp_path / "temp"
+    sensor.write_text("48123\n")
+    monkeypatch.setattr(system_metrics, "_RPI_TEMP_PATH", str(sensor))
+
+    metrics = SystemMetrics()
+    metrics.is_raspberry_pi = True
+    metrics.close()
+
+    assert metrics.get_temperature_celsius() == 48
+    metrics.close()